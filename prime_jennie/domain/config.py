@@ -9,6 +9,7 @@
 """
 
 from functools import lru_cache
+from typing import ClassVar
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -25,8 +26,9 @@ class DatabaseConfig(BaseSettings):
     password: str = ""
     name: str = "prime_jennie"
 
-    model_config = {"env_prefix": "DB_"}
+    model_config = {"env_prefix": "DB_", "frozen": True}
 
+    # 캐시하지 않음 — model_copy(update=...)는 캐시된 값까지 복사하므로 URL이 어긋남
     @property
     def url(self) -> str:
         return f"mysql+pymysql://{self.user}:{self.password}@{self.host}:{self.port}/{self.name}"
@@ -44,7 +46,7 @@ class RedisConfig(BaseSettings):
     db: int = 0
     password: str = ""
 
-    model_config = {"env_prefix": "REDIS_"}
+    model_config = {"env_prefix": "REDIS_", "frozen": True}
 
     @property
     def url(self) -> str:
@@ -112,14 +114,18 @@ class RiskConfig(BaseSettings):
 
     model_config = {"env_prefix": "RISK_"}
 
+    # 국면 → 현금 하한 필드명 (클래스당 1회 구성, 값은 조회 시점 필드에서 읽음)
+    _CASH_FLOOR_FIELDS: ClassVar[dict[MarketRegime, str]] = {
+        MarketRegime.STRONG_BULL: "cash_floor_strong_bull_pct",
+        MarketRegime.BULL: "cash_floor_bull_pct",
+        MarketRegime.SIDEWAYS: "cash_floor_sideways_pct",
+        MarketRegime.BEAR: "cash_floor_bear_pct",
+        MarketRegime.STRONG_BEAR: "cash_floor_bear_pct",
+    }
+
     def get_cash_floor(self, regime: MarketRegime) -> float:
-        return {
-            MarketRegime.STRONG_BULL: self.cash_floor_strong_bull_pct,
-            MarketRegime.BULL: self.cash_floor_bull_pct,
-            MarketRegime.SIDEWAYS: self.cash_floor_sideways_pct,
-            MarketRegime.BEAR: self.cash_floor_bear_pct,
-            MarketRegime.STRONG_BEAR: self.cash_floor_bear_pct,
-        }.get(regime, self.cash_floor_sideways_pct)
+        floor: float = getattr(self, self._CASH_FLOOR_FIELDS.get(regime, "cash_floor_sideways_pct"))
+        return floor
 
 
 class ScoringConfig(BaseSettings):
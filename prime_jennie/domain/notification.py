@@ -8,6 +8,8 @@ from pydantic import BaseModel
 class TradeNotification(BaseModel):
     """매수/매도 체결 알림 (Redis Stream 메시지)."""
 
+    model_config = {"frozen": True}
+
     trade_type: str  # "BUY" | "SELL"
     stock_code: str
     stock_name: str
@@ -98,6 +98,8 @@ class TradeRecord(BaseModel):
 class PositionSizingRequest(BaseModel):
     """포지션 사이징 입력."""
 
+    model_config = {"frozen": True}
+
     stock_code: StockCode
     stock_price: int
     atr: float  # Average True Range
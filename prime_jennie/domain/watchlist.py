@@ -11,6 +11,8 @@ from .types import Score, StockCode
 class WatchlistEntry(BaseModel):
     """Hot Watchlist 개별 종목."""
 
+    model_config = {"frozen": True}
+
     stock_code: StockCode
     stock_name: str
     quant_score: Score = 0.0
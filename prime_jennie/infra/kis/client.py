@@ -5,9 +5,13 @@ KIS Gateway 서비스(kis-gateway:8080)와 통신.
 """
 
 import logging
+import threading
 import time
+from collections.abc import Iterable
+from typing import Any
 
 import httpx
+import orjson
 
 from prime_jennie.domain import (
     OrderRequest,
@@ -21,6 +25,46 @@ from prime_jennie.domain.stock import DailyPrice, MinutePrice
 
 logger = logging.getLogger(__name__)
 
+# 일봉은 장중에도 당일 봉만 바뀌므로 짧은 TTL로 ATR/RSI 등 연속 조회가 한 번의 요청을 공유
+DAILY_PRICES_TTL = 60.0
+_DAILY_PRICES_CACHE_MAX = 4096
+# (게이트웨이 base_url, 종목, 기간) → (조회 시각, 일봉). 삽입 순서 = 오래된 순
+_DailyPricesKey = tuple[str, str, int]
+_daily_prices_cache: dict[_DailyPricesKey, tuple[float, list[DailyPrice]]] = {}
+_daily_prices_lock = threading.Lock()
+
+
+# 게이트웨이 /daily-prices/bulk 요청당 종목 수 상한
+_DAILY_PRICES_BULK_MAX = 20
+
+
+def clear_daily_prices_cache() -> None:
+    """일봉 조회 캐시 비우기 (테스트용)."""
+    _daily_prices_cache.clear()
+
+
+def _cached_daily_prices(key: _DailyPricesKey, now: float) -> list[DailyPrice] | None:
+    cached = _daily_prices_cache.get(key)
+    if cached is not None and now - cached[0] < DAILY_PRICES_TTL:
+        return list(cached[1])
+    return None
+
+
+def _store_daily_prices(key: _DailyPricesKey, now: float, prices: list[DailyPrice]) -> None:
+    # 빈 응답은 게이트웨이/KIS 일시 장애일 수 있으므로 캐시하지 않음
+    if not prices:
+        return
+    with _daily_prices_lock:
+        _daily_prices_cache.pop(key, None)
+        while len(_daily_prices_cache) >= _DAILY_PRICES_CACHE_MAX:
+            del _daily_prices_cache[next(iter(_daily_prices_cache))]
+        _daily_prices_cache[key] = (now, prices)
+
+
+def _decode(resp: httpx.Response) -> Any:
+    """행 단위 대용량 응답(일봉/분봉) 바이트를 직접 파싱."""
+    return orjson.loads(resp.content)
+
 
 class KISClient:
     """KIS Gateway HTTP 클라이언트.
@@ -146,13 +190,48 @@ class KISClient:
         return resp.json().get("cash_balance", 0)
 
     def get_daily_prices(self, stock_code: str, days: int = 150) -> list[DailyPrice]:
-        """일봉 데이터 조회."""
+        """일봉 데이터 조회 (DAILY_PRICES_TTL 동안 (게이트웨이, 종목, 기간)별 캐시)."""
+        key = (self._base_url, stock_code, days)
+        now = time.monotonic()
+        cached = _cached_daily_prices(key, now)
+        if cached is not None:
+            return cached
+
         resp = self._client.post(
             "/api/market/daily-prices",
             json={"stock_code": stock_code, "days": days},
         )
         resp.raise_for_status()
-        return [DailyPrice.model_validate(p) for p in resp.json()]
+        prices = [DailyPrice.model_validate(p) for p in _decode(resp)]
+        _store_daily_prices(key, now, prices)
+        return list(prices)
+
+    def get_daily_prices_bulk(self, stock_codes: Iterable[str], days: int = 150) -> dict[str, list[DailyPrice]]:
+        """여러 종목 일봉 일괄 조회 — 캐시에 없는 종목만 묶어서 게이트웨이 요청.
+
+        결과는 get_daily_prices와 같은 캐시에 적재되어 이후 단건 조회도 재사용.
+        """
+        now = time.monotonic()
+        result: dict[str, list[DailyPrice]] = {}
+        missing: list[str] = []
+        for code in dict.fromkeys(stock_codes):
+            cached = _cached_daily_prices((self._base_url, code, days), now)
+            if cached is None:
+                missing.append(code)
+            else:
+                result[code] = cached
+
+        for i in range(0, len(missing), _DAILY_PRICES_BULK_MAX):
+            resp = self._client.post(
+                "/api/market/daily-prices/bulk",
+                json={"stock_codes": missing[i : i + _DAILY_PRICES_BULK_MAX], "days": days},
+            )
+            resp.raise_for_status()
+            for code, rows in _decode(resp).items():
+                prices = [DailyPrice.model_validate(p) for p in rows]
+                _store_daily_prices((self._base_url, code, days), now, prices)
+                result[code] = list(prices)
+        return result
 
     def get_minute_prices(self, stock_code: str) -> list[MinutePrice]:
         """분봉 데이터 조회."""
@@ -161,7 +240,7 @@ class KISClient:
             json={"stock_code": stock_code},
         )
         resp.raise_for_status()
-        return [MinutePrice.model_validate(p) for p in resp.json()]
+        return [MinutePrice.model_validate(p) for p in _decode(resp)]
 
     def get_price(self, stock_code: str) -> StockSnapshot:
         """현재가 스냅샷 조회."""
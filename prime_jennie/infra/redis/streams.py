@@ -17,10 +17,13 @@ Usage:
     consumer.run()  # blocking
 """
 
+import contextlib
 import logging
+import queue
+import threading
 import time
-from collections.abc import Callable
-from typing import Generic, TypeVar
+from collections.abc import Callable, Sequence
+from typing import Generic, TypeVar, cast
 
 import redis
 from pydantic import BaseModel
@@ -44,11 +47,14 @@ class TypedStreamPublisher(Generic[T]):
         self._stream = stream
         self._model_class = model_class
         self._maxlen = maxlen
+        # model_dump_json 래퍼를 거치지 않고 pydantic-core 직렬화기 직접 호출 (bytes)
+        self._to_json = model_class.__pydantic_serializer__.to_json
 
     def publish(self, message: T) -> str:
         """메시지 발행. 반환값: message ID."""
-        data = {"payload": message.model_dump_json()}
-        msg_id = self._client.xadd(self._stream, data, maxlen=self._maxlen, approximate=True)
+        msg_id = self._client.xadd(
+            self._stream, {"payload": self._to_json(message)}, maxlen=self._maxlen, approximate=True
+        )
         logger.debug(
             "Published to %s: id=%s type=%s",
             self._stream,
@@ -57,6 +63,97 @@ class TypedStreamPublisher(Generic[T]):
         )
         return msg_id
 
+    def publish_many(self, messages: Sequence[T]) -> list[str]:
+        """여러 메시지를 파이프라인 1회 왕복으로 발행. 반환값: message ID 목록."""
+        pipe = self._client.pipeline(transaction=False)
+        for message in messages:
+            pipe.xadd(self._stream, {"payload": self._to_json(message)}, maxlen=self._maxlen, approximate=True)
+        return pipe.execute()
+
+
+class BackgroundStreamPublisher(Generic[T]):
+    """체결 경로를 막지 않는 발행기 — 큐에 넣고 백그라운드 스레드가 배치로 XADD.
+
+    fire-and-forget 용도: 큐가 가득 차면 메시지를 버리고 경고만 남긴다.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        stream: str,
+        model_class: type[T],
+        maxlen: int = 10000,
+        max_queue: int = 4096,
+        batch_size: int = 64,
+    ):
+        self._publisher = TypedStreamPublisher(client, stream, model_class, maxlen=maxlen)
+        self._stream = stream
+        self._queue: queue.Queue[T | object] = queue.Queue(maxsize=max_queue)
+        self._batch_size = batch_size
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """발행 스레드 시작."""
+        self._thread = threading.Thread(target=self._run, name=f"publisher-{self._stream}", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """남은 메시지를 flush한 뒤 스레드 종료 (전체 대기는 timeout 이내).
+
+        Redis 지연으로 큐가 비지 않으면 미발행 메시지를 버리고 종료 신호를 넣는다.
+        """
+        if self._thread is None:
+            return
+        deadline = time.monotonic() + timeout
+        try:
+            self._queue.put(self._STOP, timeout=timeout)
+        except queue.Full:
+            dropped = 0
+            with contextlib.suppress(queue.Empty):
+                while True:
+                    self._queue.get_nowait()
+                    dropped += 1
+            logger.warning("Publish queue not drained on stop, dropped %d: stream=%s", dropped, self._stream)
+            with contextlib.suppress(queue.Full):
+                self._queue.put_nowait(self._STOP)
+        self._thread.join(timeout=max(deadline - time.monotonic(), 0.0))
+        if self._thread.is_alive():
+            logger.warning("Publisher thread still running after stop: stream=%s", self._stream)
+        self._thread = None
+
+    def publish(self, message: T) -> None:
+        """큐에 적재 (non-blocking)."""
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            logger.warning("Publish queue full, dropping message: stream=%s", self._stream)
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch: list[T] = []
+            item = self._queue.get()
+            # 첫 메시지 이후 이미 쌓인 것만 모아서 한 번에 발행
+            while True:
+                if item is self._STOP:
+                    stopping = True
+                    break
+                batch.append(cast(T, item))
+                if len(batch) >= self._batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if not batch:
+                continue
+            try:
+                self._publisher.publish_many(batch)
+            except Exception:
+                logger.exception("Batch publish failed: stream=%s size=%d", self._stream, len(batch))
+
 
 class TypedStreamConsumer(Generic[T]):
     """Redis Stream 소비자 — Pydantic 모델 역직렬화 + handler 호출."""
@@ -15,7 +15,7 @@ from __future__ import annotations
 from datetime import date
 
 from prime_jennie.domain.enums import MarketRegime, SignalType
-from prime_jennie.services.buyer.position_sizing import calculate_rsi
+from prime_jennie.services.indicators import calculate_rsi
 from prime_jennie.services.monitor.indicators import calculate_sma
 
 from .models import DailyOHLCV, PriceCache, WatchlistEntry
@@ -20,9 +20,9 @@ from prime_jennie.domain.trading import PositionSizingRequest
 from prime_jennie.services.buyer.position_sizing import (
     calculate_atr,
     calculate_position_size,
-    calculate_rsi,
     clamp_atr,
 )
+from prime_jennie.services.indicators import calculate_rsi
 from prime_jennie.services.monitor.exit_rules import PositionContext, evaluate_exit
 from prime_jennie.services.monitor.indicators import (
     check_death_cross,
@@ -354,7 +354,9 @@ class BacktestEngine:
         history = self.prices.get_history_until(stock_code, day, n=30)
         if len(history) < 2:
             return 0.0
-        price_dicts = [{"high": p.high_price, "low": p.low_price, "close": p.close_price} for p in history]
+        price_dicts: list[dict[str, float]] = [
+            {"high": p.high_price, "low": p.low_price, "close": p.close_price} for p in history
+        ]
         atr = calculate_atr(price_dicts, period=14)
         # 주가 대비 클램프
         close = history[-1].close_price
@@ -20,7 +20,7 @@ from prime_jennie.infra.database.models import PositionDB, TradeLogDB
 from prime_jennie.infra.database.repositories import PortfolioRepository
 from prime_jennie.infra.kis.client import KISClient
 from prime_jennie.infra.redis.client import get_redis
-from prime_jennie.infra.redis.streams import TypedStreamConsumer, TypedStreamPublisher
+from prime_jennie.infra.redis.streams import BackgroundStreamPublisher, TypedStreamConsumer
 from prime_jennie.services.base import create_app
 
 from .executor import BuyExecutor, ExecutionResult
@@ -37,7 +37,7 @@ GROUP_BUY_EXECUTOR = "group_buy_executor"
 _executor: BuyExecutor | None = None
 _consumer: TypedStreamConsumer | None = None
 _consumer_thread: threading.Thread | None = None
-_notifier: TypedStreamPublisher | None = None
+_notifier: BackgroundStreamPublisher[TradeNotification] | None = None
 
 
 def _handle_signal(signal: BuySignal) -> None:
@@ -136,7 +136,10 @@ async def lifespan(app):
     guard = PortfolioGuard(redis_client)
 
     _executor = BuyExecutor(kis_client, redis_client, guard)
-    _notifier = TypedStreamPublisher(redis_client, STREAM_TRADE_NOTIFICATIONS, TradeNotification)
+    # 체결 알림은 백그라운드 스레드가 배치 발행 — 매수 처리 경로에서 Redis 왕복 제거
+    notifier = BackgroundStreamPublisher(redis_client, STREAM_TRADE_NOTIFICATIONS, TradeNotification)
+    notifier.start()
+    _notifier = notifier
 
     # Stream consumer 시작 (daemon thread)
     _consumer = TypedStreamConsumer(
@@ -158,6 +161,7 @@ async def lifespan(app):
         _consumer.stop()
     if _consumer_thread and _consumer_thread.is_alive():
         _consumer_thread.join(timeout=10)
+    notifier.stop()
     kis_client.close()
     logger.info("Buy executor shutdown complete")
 
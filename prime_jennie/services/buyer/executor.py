@@ -20,16 +20,18 @@ from prime_jennie.domain import (
     Position,
 )
 from prime_jennie.domain.config import get_config
-from prime_jennie.domain.enums import MOMENTUM_STRATEGIES, TradeTier
+from prime_jennie.domain.enums import MOMENTUM_STRATEGIES, SectorGroup, TradeTier
 from prime_jennie.domain.trading import PositionSizingRequest
 from prime_jennie.infra.kis.client import KISClient
 
+from .correlation import check_portfolio_correlation
 from .portfolio_guard import PortfolioGuard
 from .position_sizing import (
     calculate_atr,
     calculate_position_size,
     clamp_atr,
     get_stale_multiplier,
+    to_ohlc_array,
 )
 
 logger = logging.getLogger(__name__)
@@ -245,8 +247,6 @@ class BuyExecutor:
         total_assets = balance + portfolio_value
         buy_amount = sizing.quantity * current_price
 
-        from prime_jennie.domain.enums import SectorGroup
-
         guard_result = self._guard.check_all(
             sector_group=sizing_request.sector_group or SectorGroup.ETC,
             buy_amount=buy_amount,
@@ -417,8 +417,7 @@ class BuyExecutor:
         try:
             daily_prices = self._kis.get_daily_prices(stock_code, days=30)
             if len(daily_prices) >= 2:
-                price_dicts = [{"high": p.high_price, "low": p.low_price, "close": p.close_price} for p in daily_prices]
-                atr = calculate_atr(price_dicts)
+                atr = calculate_atr(to_ohlc_array(daily_prices))
                 if atr > 0:
                     return clamp_atr(atr, current_price)
         except Exception:
@@ -471,19 +470,26 @@ class BuyExecutor:
 
     def _check_correlation(self, stock_code: str, positions: list[Position]) -> tuple[bool, float, str]:
         """보유 종목과 상관관계 체크."""
-        from .correlation import check_portfolio_correlation
+        # 후보 + 보유 종목 일봉을 한 번에 조회 — 실패/누락 종목은 단건 조회로 폴백
+        codes = [stock_code, *(p.stock_code for p in positions)]
+        try:
+            daily_by_code = self._kis.get_daily_prices_bulk(codes, days=60)
+        except Exception:
+            logger.debug("[%s] Bulk daily prices failed, falling back to per-code fetch", stock_code)
+            daily_by_code = {}
+
+        def price_lookup(code: str) -> list[float]:
+            daily = daily_by_code.get(code)
+            if daily is None:
+                daily = self._kis.get_daily_prices(code, days=60)
+            return [p.close_price for p in daily]
 
         try:
-            daily = self._kis.get_daily_prices(stock_code, days=60)
-            candidate_prices = [p.close_price for p in daily]
+            candidate_prices = price_lookup(stock_code)
         except Exception:
             logger.debug("[%s] Daily prices fetch failed for correlation", stock_code)
             return (True, 0.0, "Price data unavailable")
 
-        def price_lookup(code: str) -> list[float]:
-            daily_p = self._kis.get_daily_prices(code, days=60)
-            return [p.close_price for p in daily_p]
-
         return check_portfolio_correlation(
             candidate_code=stock_code,
             candidate_prices=candidate_prices,
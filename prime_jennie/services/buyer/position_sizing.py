@@ -5,10 +5,17 @@ ATR(Average True Range)을 이용한 리스크 패리티 포지션 사이징.
 """
 
 import logging
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
 
 from prime_jennie.domain.config import get_config
 from prime_jennie.domain.enums import RiskTag, SectorGroup, TradeTier
+from prime_jennie.domain.stock import DailyPrice
 from prime_jennie.domain.trading import PositionSizingRequest, PositionSizingResult
+from prime_jennie.services.indicators import calculate_rsi as calculate_rsi  # 하위 호환 re-export
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +29,15 @@ MIN_QUANTITY = 1
 MAX_QUANTITY = 10000
 CASH_KEEP_PCT = 10.0
 
+# 구간 테이블 (bisect 조회)
+_TIER1_SCORE_THRESHOLDS = (70, 75, 80, 85)
+_TIER1_SCORE_MULTIPLIERS = (0.6, 0.7, 0.8, 0.9, 1.0)
+_STALE_DAY_THRESHOLDS = (1, 2)
+_STALE_MULTIPLIERS = (1.0, 0.5, 0.3)
+
+# calculate_atr 입력용 SoA 레이아웃
+OHLC_DTYPE = np.dtype([("high", np.float64), ("low", np.float64), ("close", np.float64)])
+
 
 def get_dynamic_max_position_pct(llm_score: float) -> float:
     """LLM 점수에 따른 최대 포지션 비중."""
@@ -56,15 +72,7 @@ def get_tier_multiplier(trade_tier: TradeTier, hybrid_score: float = 0.0) -> flo
     if trade_tier == TradeTier.TIER2:
         return 0.5
     # TIER1: hybrid_score 기반 세분화
-    if hybrid_score >= 85:
-        return 1.0
-    if hybrid_score >= 80:
-        return 0.9
-    if hybrid_score >= 75:
-        return 0.8
-    if hybrid_score >= 70:
-        return 0.7
-    return 0.6
+    return _TIER1_SCORE_MULTIPLIERS[bisect_right(_TIER1_SCORE_THRESHOLDS, hybrid_score)]
 
 
 def get_risk_tag_multiplier(risk_tag: RiskTag) -> float:
@@ -84,11 +92,7 @@ def get_stale_multiplier(stale_days: int) -> float:
     2일: 0.5
     3일+: 0.3
     """
-    if stale_days <= 1:
-        return 1.0
-    if stale_days == 2:
-        return 0.5
-    return 0.3
+    return _STALE_MULTIPLIERS[bisect_left(_STALE_DAY_THRESHOLDS, stale_days)]
 
 
 def calculate_position_size(request: PositionSizingRequest) -> PositionSizingResult:
@@ -226,63 +230,40 @@ def calculate_position_size(request: PositionSizingRequest) -> PositionSizingRes
     )
 
 
-def calculate_atr(prices: list[dict], period: int = 14) -> float:
+def to_ohlc_array(daily_prices: Sequence[DailyPrice]) -> npt.NDArray[np.void]:
+    """일봉 리스트 → high/low/close structured array (봉별 dict 생성 없이 한 번에 변환)."""
+    return np.fromiter(
+        ((p.high_price, p.low_price, p.close_price) for p in daily_prices),
+        dtype=OHLC_DTYPE,
+        count=len(daily_prices),
+    )
+
+
+def calculate_atr(prices: list[dict[str, float]] | npt.NDArray[np.void], period: int = 14) -> float:
     """True Range 기반 ATR 계산.
 
     prices: [{"high": int, "low": int, "close": int}, ...]
+    또는 high/low/close 필드를 가진 numpy structured array.
     """
-    if len(prices) < 2:
-        return 0.0
-
-    true_ranges = []
-    for i in range(1, len(prices)):
-        high = prices[i]["high"]
-        low = prices[i]["low"]
-        prev_close = prices[i - 1]["close"]
-        tr = max(
-            high - low,
-            abs(high - prev_close),
-            abs(low - prev_close),
-        )
-        true_ranges.append(tr)
-
-    if not true_ranges:
+    n = len(prices)
+    if n < 2:
         return 0.0
 
-    # 최근 period만 사용
-    recent = true_ranges[-period:]
-    return sum(recent) / len(recent)
-
-
-def calculate_rsi(close_prices: list[float], period: int = 14) -> float | None:
-    """14-period RSI 계산.
-
-    close_prices: 시간순 종가 리스트 (oldest → newest).
-    최소 period+1 개 필요. 데이터 부족 시 None.
-    """
-    if len(close_prices) < period + 1:
-        return None
-
-    gains = []
-    losses = []
-    for i in range(1, len(close_prices)):
-        delta = close_prices[i] - close_prices[i - 1]
-        gains.append(max(0, delta))
-        losses.append(max(0, -delta))
-
-    # Wilder's Smoothing (EMA)
-    avg_gain = sum(gains[:period]) / period
-    avg_loss = sum(losses[:period]) / period
-
-    for i in range(period, len(gains)):
-        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-
-    if avg_loss == 0:
-        return 100.0
-
-    rs = avg_gain / avg_loss
-    return 100.0 - (100.0 / (1.0 + rs))
+    # 최근 period개의 True Range만 필요 → 직전 종가 포함 period+1개 봉만 변환
+    window = prices[max(0, n - period - 1) :]
+    if isinstance(window, np.ndarray):
+        high = window["high"].astype(np.float64)
+        low = window["low"].astype(np.float64)
+        close = window["close"].astype(np.float64)
+    else:
+        count = len(window)
+        high = np.fromiter((bar["high"] for bar in window), dtype=np.float64, count=count)
+        low = np.fromiter((bar["low"] for bar in window), dtype=np.float64, count=count)
+        close = np.fromiter((bar["close"] for bar in window), dtype=np.float64, count=count)
+
+    prev_close = close[:-1]
+    true_range = np.maximum.reduce([high[1:] - low[1:], np.abs(high[1:] - prev_close), np.abs(low[1:] - prev_close)])
+    return float(true_range.mean())
 
 
 def clamp_atr(atr: float, stock_price: float) -> float:
@@ -17,19 +17,23 @@ Endpoints (04-service-contracts.md):
     GET  /health                  → HealthStatus
 """
 
+import asyncio
 import logging
 import time
 from collections import deque
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
+from typing import Annotated
 
 import pybreaker
 from fastapi import Depends, HTTPException, Request
+from limits import parse
 from pydantic import BaseModel, Field
 from slowapi import Limiter
 from slowapi.errors import RateLimitExceeded
 from sqlmodel import Session
+from starlette.concurrency import run_in_threadpool
 
 from prime_jennie.domain.config import get_config
 from prime_jennie.domain.portfolio import PortfolioState, Position
@@ -48,8 +52,16 @@ logger = logging.getLogger(__name__)
 
 # ─── Rate Limiter ────────────────────────────────────────────────
 
+_KIS_ACCOUNT_KEY = "global_kis_account"
+
 # 글로벌 KIS 계정 레이트 리밋 (IP가 아닌 계정 기반)
-_limiter = Limiter(key_func=lambda *args, **kwargs: "global_kis_account")
+_limiter = Limiter(key_func=lambda *args, **kwargs: _KIS_ACCOUNT_KEY)
+
+# 일봉 조회 공용 버킷: 단건 엔드포인트는 요청당, 일괄 엔드포인트는 종목당 1회 차감
+_DAILY_PRICES_LIMIT = "19/second"
+_DAILY_PRICES_SCOPE = "kis_daily_prices"
+_daily_prices_rate = parse(_DAILY_PRICES_LIMIT)
+DAILY_PRICES_BULK_MAX = 20
 
 
 # ─── Circuit Breaker ─────────────────────────────────────────────
@@ -95,6 +107,11 @@ class DailyPricesRequest(BaseModel):
     days: int = Field(default=150, ge=1, le=500)
 
 
+class DailyPricesBulkRequest(BaseModel):
+    stock_codes: list[Annotated[str, Field(pattern=r"^\d{6}$")]] = Field(min_length=1, max_length=DAILY_PRICES_BULK_MAX)
+    days: int = Field(default=150, ge=1, le=500)
+
+
 class MinutePricesRequest(BaseModel):
     stock_code: str = Field(pattern=r"^\d{6}$")
 
@@ -199,20 +216,13 @@ async def market_snapshot(request: Request, body: SnapshotRequest) -> StockSnaps
         raise HTTPException(502, f"KIS API error: {e}") from e
 
 
-@app.post("/api/market/daily-prices", response_model=list[DailyPrice])
-@_limiter.limit("19/second")
-async def market_daily_prices(
-    request: Request,
-    body: DailyPricesRequest,
-    session: Session = Depends(get_db_session),
-) -> list[DailyPrice]:
-    """일봉 데이터 조회. KIS API 실패 시 DB 폴백."""
-    _record_request("daily_prices", body.stock_code)
+def _daily_prices_or_db(session: Session, stock_code: str, days: int) -> list[DailyPrice]:
+    """KIS 일봉 조회, 실패 시 DB 폴백."""
     try:
-        return _circuit_breaker.call(_get_kis_api().get_daily_prices, body.stock_code, body.days)
+        return _circuit_breaker.call(_get_kis_api().get_daily_prices, stock_code, days)
     except (pybreaker.CircuitBreakerError, KISApiError):
-        logger.warning("KIS daily-prices failed, falling back to DB for %s", body.stock_code)
-        db_rows = StockRepository.get_daily_prices(session, body.stock_code, body.days)
+        logger.warning("KIS daily-prices failed, falling back to DB for %s", stock_code)
+        db_rows = StockRepository.get_daily_prices(session, stock_code, days)
         return [
             DailyPrice(
                 stock_code=row.stock_code,
@@ -228,6 +238,52 @@ async def market_daily_prices(
         ]
 
 
+@app.post("/api/market/daily-prices", response_model=list[DailyPrice])
+@_limiter.shared_limit(_DAILY_PRICES_LIMIT, scope=_DAILY_PRICES_SCOPE)
+async def market_daily_prices(
+    request: Request,
+    body: DailyPricesRequest,
+    session: Session = Depends(get_db_session),
+) -> list[DailyPrice]:
+    """일봉 데이터 조회. KIS API 실패 시 DB 폴백."""
+    _record_request("daily_prices", body.stock_code)
+    return _daily_prices_or_db(session, body.stock_code, body.days)
+
+
+async def _acquire_daily_prices_slot() -> None:
+    """일봉 공용 버킷에서 KIS 호출 1건분 차감. 한도 소진 시 429 대신 윈도 리셋까지 대기."""
+    if not _limiter.enabled:
+        return
+    strategy = _limiter.limiter
+    while not strategy.hit(_daily_prices_rate, _KIS_ACCOUNT_KEY, _DAILY_PRICES_SCOPE):
+        reset_at, _ = strategy.get_window_stats(_daily_prices_rate, _KIS_ACCOUNT_KEY, _DAILY_PRICES_SCOPE)
+        await asyncio.sleep(max(reset_at - time.time(), 0.01))
+
+
+@app.post("/api/market/daily-prices/bulk", response_model=dict[str, list[DailyPrice]])
+async def market_daily_prices_bulk(
+    request: Request,
+    body: DailyPricesBulkRequest,
+    session: Session = Depends(get_db_session),
+) -> dict[str, list[DailyPrice]]:
+    """여러 종목 일봉 일괄 조회 (클라이언트 왕복 1회).
+
+    KIS 호출은 종목별로 나가므로 단건 엔드포인트와 같은 버킷을 종목마다 차감.
+    조회 실패 종목은 결과에서 제외.
+    """
+    _record_request("daily_prices_bulk", ",".join(body.stock_codes))
+    result: dict[str, list[DailyPrice]] = {}
+    for code in dict.fromkeys(body.stock_codes):
+        await _acquire_daily_prices_slot()
+        try:
+            # KIS/DB 호출은 블로킹 → 종목 20개 연속 조회 동안 이벤트 루프 점유 방지
+            result[code] = await run_in_threadpool(_daily_prices_or_db, session, code, body.days)
+        except Exception as e:
+            logger.warning("Bulk daily-prices failed for %s: %s", code, e)
+            session.rollback()
+    return result
+
+
 @app.post("/api/market/minute-prices", response_model=list[MinutePrice])
 @_limiter.limit("19/second")
 async def market_minute_prices(request: Request, body: MinutePricesRequest) -> list[MinutePrice]:
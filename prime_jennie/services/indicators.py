@@ -0,0 +1,37 @@
+"""공용 기술적 지표 커널 — 서비스 간 공유 (buyer/scout/scanner/monitor/backtest).
+
+특정 서비스 패키지에 의존하지 않도록 numpy만 사용.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+
+def calculate_rsi(close_prices: Sequence[float] | npt.NDArray[np.float64], period: int = 14) -> float | None:
+    """14-period Wilder RSI 계산.
+
+    close_prices: 시간순 종가 리스트 또는 배열 (oldest → newest).
+    최소 period+1 개 필요. 데이터 부족 시 None.
+    """
+    prices = np.asarray(close_prices, dtype=np.float64)
+    if prices.size < period + 1:
+        return None
+
+    deltas = np.diff(prices)
+    gains = np.clip(deltas, 0.0, None)
+    losses = np.clip(-deltas, 0.0, None)
+
+    # Wilder's Smoothing: avg_n = avg_0·α^n + Σ x_k·α^(n-1-k) / period (α = (period-1)/period)
+    alpha = (period - 1) / period
+    n_smooth = deltas.size - period
+    weights = alpha ** np.arange(n_smooth - 1, -1, -1) / period
+    avg_gain = float(gains[:period].mean() * alpha**n_smooth + gains[period:] @ weights)
+    avg_loss = float(losses[:period].mean() * alpha**n_smooth + losses[period:] @ weights)
+
+    if avg_loss == 0:
+        return 100.0
+
+    rs = avg_gain / avg_loss
+    return 100.0 - (100.0 / (1.0 + rs))
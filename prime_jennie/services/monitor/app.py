@@ -12,6 +12,7 @@ Data Flow:
 """
 
 import contextlib
+import json
 import logging
 import threading
 import time
@@ -37,9 +38,12 @@ from prime_jennie.infra.redis.cache import TypedCache
 from prime_jennie.infra.redis.client import get_redis
 from prime_jennie.infra.redis.streams import TypedStreamPublisher
 from prime_jennie.services.base import create_app
+from prime_jennie.services.buyer.position_sizing import calculate_atr, to_ohlc_array
+from prime_jennie.services.indicators import calculate_rsi
 from prime_jennie.services.signal_logger import log_sell_signal
 
 from .exit_rules import ExitSignal, PositionContext, evaluate_exit
+from .indicators import check_death_cross, check_macd_bearish_divergence
 
 logger = logging.getLogger(__name__)
 
@@ -140,6 +144,12 @@ class PriceMonitor:
         # _positions 갱신
         self._positions = {p.stock_code: p for p in positions}
 
+        # 보유 종목 일봉 일괄 조회로 클라이언트 캐시 적재 → 종목별 지표 계산은 캐시 사용
+        try:
+            self._kis.get_daily_prices_bulk(new_codes, days=60)
+        except Exception as e:
+            logger.warning("Bulk daily prices fetch failed, falling back to per-stock: %s", e)
+
         # daily_prices 1회 fetch → RSI + ATR + indicators 일괄 계산
         for code in new_codes:
             self._compute_all_indicators(code)
@@ -427,8 +437,6 @@ class PriceMonitor:
         indicators = IndicatorCache()
         if len(close_prices) >= 21:
             try:
-                from .indicators import check_death_cross, check_macd_bearish_divergence
-
                 indicators.death_cross = check_death_cross(close_prices)
                 if len(close_prices) >= 36:
                     indicators.macd_bearish = check_macd_bearish_divergence(close_prices)
@@ -441,8 +449,6 @@ class PriceMonitor:
         if len(close_prices) < 15:
             return None
         try:
-            from prime_jennie.services.buyer.position_sizing import calculate_rsi
-
             return calculate_rsi(close_prices)
         except Exception:
             return None
@@ -452,10 +458,7 @@ class PriceMonitor:
         if len(daily_prices) < 2:
             return 0.0
         try:
-            from prime_jennie.services.buyer.position_sizing import calculate_atr
-
-            price_dicts = [{"high": p.high_price, "low": p.low_price, "close": p.close_price} for p in daily_prices]
-            return calculate_atr(price_dicts)
+            return calculate_atr(to_ohlc_array(daily_prices))
         except Exception:
             return 0.0
 
@@ -567,9 +570,7 @@ class PriceMonitor:
             "Monitor status: watching %d positions",
             len(self._positions),
         )
-        try:
-            import json
-
+        with contextlib.suppress(Exception):
             self._redis.setex(
                 MONITOR_STATUS_KEY,
                 60,
@@ -581,8 +582,6 @@ class PriceMonitor:
                     }
                 ),
             )
-        except Exception:
-            pass
 
     def _publish_live_snapshot(self) -> None:
         """인메모리 포지션 → Redis 캐싱 (대시보드 실시간 표시용, 30초 스로틀)."""
@@ -595,8 +594,6 @@ class PriceMonitor:
             return
 
         try:
-            import json
-
             snapshot = []
             for pos in self._positions.values():
                 cur = pos.current_price or 0
@@ -5,6 +5,8 @@ pandas 없이 순수 Python으로 구현.
 
 import math
 
+from prime_jennie.services.indicators import calculate_rsi as calculate_rsi  # 공용 Wilder RSI re-export
+
 
 def calculate_sma(prices: list[float], period: int) -> list[float | None]:
     """단순이동평균 계산.
@@ -42,37 +44,6 @@ def calculate_ema(prices: list[float], span: int) -> list[float]:
     return result
 
 
-def calculate_rsi(closes: list[float], period: int = 14) -> float | None:
-    """RSI(Relative Strength Index) 계산.
-
-    EMA smoothing 방식 (Wilder's smoothing).
-
-    Returns:
-        RSI 값 (0-100) 또는 데이터 부족 시 None.
-    """
-    if len(closes) < period + 1:
-        return None
-
-    gains = []
-    losses = []
-    for i in range(1, len(closes)):
-        delta = closes[i] - closes[i - 1]
-        gains.append(max(0, delta))
-        losses.append(max(0, -delta))
-
-    avg_gain = sum(gains[:period]) / period
-    avg_loss = sum(losses[:period]) / period
-
-    for i in range(period, len(gains)):
-        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-
-    if avg_loss == 0:
-        return 100.0
-    rs = avg_gain / avg_loss
-    return 100 - (100 / (1 + rs))
-
-
 def calculate_bollinger_bands(
     prices: list[float],
     period: int = 20,
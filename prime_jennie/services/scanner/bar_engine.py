@@ -14,7 +14,9 @@ logger = logging.getLogger(__name__)
 
 
 class Bar(BaseModel):
-    """1분 캔들스틱."""
+    """1분 캔들스틱 (완성 후 불변)."""
+
+    model_config = {"frozen": True}
 
     timestamp: float
     open: float
@@ -7,7 +7,9 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 from datetime import datetime, time
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -47,7 +49,9 @@ def _kst_now() -> datetime:
     return datetime.now(ZoneInfo("Asia/Seoul"))
 
 
+@lru_cache(maxsize=32)
 def _parse_time(s: str) -> time:
+    """'HH:MM' → time (설정 문자열은 고정이므로 캐시)."""
     parts = s.split(":")
     return time(int(parts[0]), int(parts[1]))
 
@@ -250,6 +254,45 @@ def check_strategy_alignment(signal_type: str, context: TradingContext) -> GateR
     return GateResult(True, "strategy_alignment")
 
 
+def _iter_gates(
+    stock_code: str,
+    bars: list[Bar],
+    current_price: float,
+    rsi: float | None,
+    volume_ratio: float,
+    vwap: float,
+    trade_tier: TradeTier,
+    context: TradingContext,
+    config: ScannerConfig,
+    last_signal_times: dict[str, float],
+    redis_client: redis.Redis | None,
+) -> Iterator[GateResult]:
+    """게이트를 순서대로 하나씩 평가 (호출마다 클로저 목록을 만들지 않음)."""
+    yield check_min_bars(bars, config.min_required_bars)
+    yield check_no_trade_window(config)
+    yield check_danger_zone(config)
+    yield check_rsi_guard(
+        rsi,
+        config.rsi_guard_bull_max
+        if context.market_regime in (MarketRegime.BULL, MarketRegime.STRONG_BULL)
+        else config.rsi_guard_max,
+    )
+    yield check_macro_risk(context)
+    yield check_market_regime(context.market_regime, block_bear=False)
+    yield check_combined_risk(
+        volume_ratio,
+        vwap,
+        current_price,
+        config.volume_ratio_warning,
+        config.vwap_deviation_warning,
+    )
+    yield check_cooldown(stock_code, last_signal_times, config.signal_cooldown_seconds)
+    yield check_stoploss_cooldown(stock_code, redis_client)
+    yield check_sell_cooldown(stock_code, redis_client)
+    yield check_trade_tier(trade_tier)
+    yield check_micro_timing(bars)
+
+
 def run_all_gates(
     stock_code: str,
     bars: list[Bar],
@@ -264,38 +307,20 @@ def run_all_gates(
     redis_client: redis.Redis | None = None,
 ) -> GateResult:
     """모든 게이트 순차 실행. 첫 번째 실패 시 즉시 반환."""
-    gates = [
-        lambda: check_min_bars(bars, config.min_required_bars),
-        lambda: check_no_trade_window(config),
-        lambda: check_danger_zone(config),
-        lambda: check_rsi_guard(
-            rsi,
-            config.rsi_guard_bull_max
-            if context.market_regime in (MarketRegime.BULL, MarketRegime.STRONG_BULL)
-            else config.rsi_guard_max,
-        ),
-        lambda: check_macro_risk(context),
-        lambda: check_market_regime(context.market_regime, block_bear=False),
-        lambda: check_combined_risk(
-            volume_ratio,
-            vwap,
-            current_price,
-            config.volume_ratio_warning,
-            config.vwap_deviation_warning,
-        ),
-        lambda: check_cooldown(
-            stock_code,
-            last_signal_times,
-            config.signal_cooldown_seconds,
-        ),
-        lambda: check_stoploss_cooldown(stock_code, redis_client),
-        lambda: check_sell_cooldown(stock_code, redis_client),
-        lambda: check_trade_tier(trade_tier),
-        lambda: check_micro_timing(bars),
-    ]
-
-    for gate_fn in gates:
-        result = gate_fn()
+    gates = _iter_gates(
+        stock_code,
+        bars,
+        current_price,
+        rsi,
+        volume_ratio,
+        vwap,
+        trade_tier,
+        context,
+        config,
+        last_signal_times,
+        redis_client,
+    )
+    for result in gates:
         if not result:
             logger.info(
                 "[%s] Gate FAIL: %s — %s",
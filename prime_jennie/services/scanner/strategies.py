@@ -4,11 +4,16 @@
 """
 
 import logging
+from collections.abc import Sequence
 from datetime import UTC, datetime
 
+import numpy as np
+import numpy.typing as npt
+
 from prime_jennie.domain.config import ScannerConfig
 from prime_jennie.domain.enums import MarketRegime, SignalType
 from prime_jennie.domain.watchlist import WatchlistEntry
+from prime_jennie.services.indicators import calculate_rsi
 
 from .bar_engine import Bar
 
@@ -31,41 +36,17 @@ class StrategyResult:
         self.reason = reason
 
 
-def _compute_sma(prices: list[float], period: int) -> float | None:
+def _compute_sma(prices: Sequence[float] | npt.NDArray[np.float64], period: int) -> float | None:
     """단순 이동평균."""
     if len(prices) < period:
         return None
-    return sum(prices[-period:]) / period
-
-
-def _compute_rsi(closes: list[float], period: int = 14) -> float | None:
-    """EMA 기반 RSI."""
-    if len(closes) < period + 1:
-        return None
-
-    deltas = [closes[i] - closes[i - 1] for i in range(1, len(closes))]
-    gains = [max(d, 0) for d in deltas]
-    losses = [abs(min(d, 0)) for d in deltas]
-
-    # 초기 SMA
-    avg_gain = sum(gains[:period]) / period
-    avg_loss = sum(losses[:period]) / period
-
-    # EMA smoothing
-    for i in range(period, len(gains)):
-        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-
-    if avg_loss == 0:
-        return 100.0
-    rs = avg_gain / avg_loss
-    return 100 - (100 / (1 + rs))
+    return float(sum(prices[-period:]) / period)
 
 
 def compute_rsi_from_bars(bars: list[Bar], period: int = 14) -> float | None:
     """바 리스트에서 RSI 계산."""
-    closes = [b.close for b in bars]
-    return _compute_rsi(closes, period)
+    closes = np.fromiter((b.close for b in bars), dtype=np.float64, count=len(bars))
+    return calculate_rsi(closes, period)
 
 
 def detect_golden_cross(
@@ -80,16 +61,14 @@ def detect_golden_cross(
         return StrategyResult(False)
 
     closes = [b.close for b in bars]
-    ma_short = _compute_sma(closes, short_period)
-    ma_long = _compute_sma(closes, long_period)
+    short_sum = sum(closes[-short_period:])
+    long_sum = sum(closes[-long_period:])
+    ma_short = short_sum / short_period
+    ma_long = long_sum / long_period
 
-    # 이전 바 기준
-    prev_closes = closes[:-1]
-    prev_short = _compute_sma(prev_closes, short_period)
-    prev_long = _compute_sma(prev_closes, long_period)
-
-    if None in (ma_short, ma_long, prev_short, prev_long):
-        return StrategyResult(False)
+    # 이전 바 기준: 윈도우를 한 칸 되돌림 (최신 종가 제외, 윈도우 직전 종가 포함)
+    prev_short = (short_sum - closes[-1] + closes[-1 - short_period]) / short_period
+    prev_long = (long_sum - closes[-1] + closes[-1 - long_period]) / long_period
 
     # 교차: 이전에는 아래, 현재는 위
     crossed = prev_short <= prev_long and ma_short > ma_long
@@ -131,8 +110,8 @@ def detect_rsi_rebound(
             MarketRegime.STRONG_BEAR: 25.0,
         }.get(regime, 35.0)
 
-    curr_rsi = _compute_rsi(closes, 14)
-    prev_rsi = _compute_rsi(closes[:-1], 14)
+    curr_rsi = calculate_rsi(closes, 14)
+    prev_rsi = calculate_rsi(closes[:-1], 14)
 
     if curr_rsi is None or prev_rsi is None:
         return StrategyResult(False)
@@ -5,6 +5,7 @@
 """
 
 import logging
+from bisect import bisect_right
 from datetime import UTC, datetime
 from typing import Any
 
@@ -29,6 +30,12 @@ ANALYST_RESPONSE_SCHEMA = {
     "required": ["score", "grade", "reason"],
 }
 
+# 점수 구간 → 등급 (하한 이상이면 다음 구간)
+_TIER_THRESHOLDS = (40, 60)
+_TIER_VALUES = (TradeTier.BLOCKED, TradeTier.TIER2, TradeTier.TIER1)
+_GRADE_THRESHOLDS = (35, 50, 65, 80)
+_GRADE_VALUES = ("D", "C", "B", "A", "S")
+
 
 async def run_analyst(
     quant: QuantScore,
@@ -104,29 +111,29 @@ def classify_risk_tag(quant: QuantScore, candidate: EnrichedCandidate) -> RiskTa
     prices = candidate.daily_prices
     snapshot = candidate.snapshot
 
-    # DISTRIBUTION_RISK: 고점 부근 + RSI 과열 + 수급 악화
-    if snapshot and prices and len(prices) >= 20:
+    if snapshot and prices and len(prices) >= 14:
+        # 종가/RSI는 한 번만 계산해 두 규칙에서 공유
         closes = [p.close_price for p in prices]
         rsi = _compute_rsi_quick(closes)
 
-        # 52주 고점 대비
-        high_52w = snapshot.high_52w or max(closes)
-        drawdown_pct = (snapshot.price / high_52w - 1) * 100 if high_52w > 0 else -100
+        # DISTRIBUTION_RISK: 고점 부근 + RSI 과열 + 수급 악화
+        if len(prices) >= 20:
+            # 52주 고점 대비
+            high_52w = snapshot.high_52w or max(closes)
+            drawdown_pct = (snapshot.price / high_52w - 1) * 100 if high_52w > 0 else -100
 
-        # 수급 악화 (3배 강화: 소규모 이탈은 DISTRIBUTION_RISK 미발동)
-        foreign_negative = it and it.foreign_net_buy_sum < -3e9
-        inst_negative = it and it.institution_net_buy_sum < -3e9
+            # 수급 악화 (3배 강화: 소규모 이탈은 DISTRIBUTION_RISK 미발동)
+            foreign_negative = it and it.foreign_net_buy_sum < -3e9
+            inst_negative = it and it.institution_net_buy_sum < -3e9
 
-        if drawdown_pct > -3 and rsi and rsi > 70 and foreign_negative and inst_negative:
-            return RiskTag.DISTRIBUTION_RISK
+            if drawdown_pct > -3 and rsi and rsi > 70 and foreign_negative and inst_negative:
+                return RiskTag.DISTRIBUTION_RISK
 
-    # CAUTION: 극단 과매수 OR 수급 급감
-    if snapshot and prices and len(prices) >= 14:
-        closes = [p.close_price for p in prices]
-        rsi = _compute_rsi_quick(closes)
+        # CAUTION: 극단 과매수
         if rsi and rsi > 80:
             return RiskTag.CAUTION
 
+    # CAUTION: 수급 급감
     if it and it.foreign_net_buy_sum < -3e9:
         return RiskTag.CAUTION
 
@@ -240,25 +247,13 @@ def _clamp_score(raw: float, quant: float, clamp_range: int) -> float:
 
 
 def _assign_trade_tier(hybrid_score: float) -> TradeTier:
-    """점수 기반 거래 등급 배정."""
-    if hybrid_score >= 60:
-        return TradeTier.TIER1
-    elif hybrid_score >= 40:
-        return TradeTier.TIER2
-    else:
-        return TradeTier.BLOCKED
+    """점수 기반 거래 등급 배정 (60+ TIER1, 40+ TIER2, 그 외 BLOCKED)."""
+    return _TIER_VALUES[bisect_right(_TIER_THRESHOLDS, hybrid_score)]
 
 
 def _score_to_grade(score: float) -> str:
-    if score >= 80:
-        return "S"
-    elif score >= 65:
-        return "A"
-    elif score >= 50:
-        return "B"
-    elif score >= 35:
-        return "C"
-    return "D"
+    """점수 → LLM 등급 (80+ S, 65+ A, 50+ B, 35+ C, 그 외 D)."""
+    return _GRADE_VALUES[bisect_right(_GRADE_THRESHOLDS, score)]
 
 
 def _compute_rsi_quick(closes: list[int | float], period: int = 14) -> float | None:
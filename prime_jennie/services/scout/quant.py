@@ -17,6 +17,7 @@ import logging
 from prime_jennie.domain.enums import MarketRegime
 from prime_jennie.domain.scoring import QuantScore
 from prime_jennie.domain.stock import DailyPrice
+from prime_jennie.services.indicators import calculate_rsi
 
 from .enrichment import EnrichedCandidate
 
@@ -117,7 +118,7 @@ def _momentum_score(
     closes = [p.close_price for p in prices]
 
     # 1. RSI 기반 (0-5): Regime 연동 — BULL에서 70-80은 페널티 없음
-    rsi = _compute_rsi(closes, period=14)
+    rsi = calculate_rsi(closes, period=14)
     if rsi is not None:
         if 40 <= rsi <= 70:
             score += 5.0
@@ -300,8 +301,10 @@ def _technical_score(prices: list[DailyPrice]) -> float:
         return V2_NEUTRAL["technical"]
 
     score = 0.0
-    closes = [p.close_price for p in prices]
-    volumes = [p.volume for p in prices]
+    # MA20/거래량 20일 평균까지만 사용 → 최근 20개만 추출
+    recent = prices[-20:]
+    closes = [p.close_price for p in recent]
+    volumes = [p.volume for p in recent]
 
     # 이평선 정배열 (0-5): 5MA > 20MA > 60MA
     ma5 = sum(closes[-5:]) / 5
@@ -398,33 +401,6 @@ def _supply_demand_score(candidate: EnrichedCandidate) -> float:
 # ─── Helpers ─────────────────────────────────────────────────────
 
 
-def _compute_rsi(closes: list[int | float], period: int = 14) -> float | None:
-    """RSI 계산."""
-    if len(closes) < period + 1:
-        return None
-
-    gains = []
-    losses = []
-    for i in range(1, len(closes)):
-        delta = closes[i] - closes[i - 1]
-        gains.append(max(0, delta))
-        losses.append(max(0, -delta))
-
-    # 초기 평균
-    avg_gain = sum(gains[:period]) / period
-    avg_loss = sum(losses[:period]) / period
-
-    # EMA 방식
-    for i in range(period, len(gains)):
-        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-
-    if avg_loss == 0:
-        return 100.0
-    rs = avg_gain / avg_loss
-    return 100 - (100 / (1 + rs))
-
-
 def _linear_map(value: float, in_min: float, in_max: float, out_min: float, out_max: float) -> float:
     """선형 매핑: value를 [in_min, in_max] → [out_min, out_max]로 변환."""
     clamped = max(in_min, min(in_max, value))
@@ -450,7 +426,7 @@ def _log_shadow_comparison(
       - 섹터 모멘텀 없음 (현재: 0-10pt)
     """
     closes = [p.close_price for p in prices]
-    rsi = _compute_rsi(closes, period=14)
+    rsi = calculate_rsi(closes, period=14)
     ft = candidate.financial_trend
     snap = candidate.snapshot
 
@@ -6,7 +6,7 @@ from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 
 import redis
-from sqlmodel import Session
+from sqlmodel import Session, text
 
 from prime_jennie.domain.config import get_config
 from prime_jennie.domain.notification import TradeNotification
@@ -15,7 +15,7 @@ from prime_jennie.infra.database.engine import get_engine
 from prime_jennie.infra.database.models import TradeLogDB
 from prime_jennie.infra.database.repositories import PortfolioRepository
 from prime_jennie.infra.kis.client import KISClient
-from prime_jennie.infra.redis.streams import TypedStreamConsumer, TypedStreamPublisher
+from prime_jennie.infra.redis.streams import BackgroundStreamPublisher, TypedStreamConsumer
 from prime_jennie.services.base import create_app
 
 from .executor import SellExecutor, SellResult
@@ -35,7 +35,8 @@ async def lifespan(app):
     kis = KISClient()
     executor = SellExecutor(kis, r)
     app.state.executor = executor
-    notifier = TypedStreamPublisher(r, STREAM_TRADE_NOTIFICATIONS, TradeNotification)
+    notifier = BackgroundStreamPublisher(r, STREAM_TRADE_NOTIFICATIONS, TradeNotification)
+    notifier.start()
 
     def handler(order: SellOrder):
         result = executor.process_signal(order)
@@ -67,6 +68,7 @@ async def lifespan(app):
     yield
 
     consumer.stop()
+    notifier.stop()
     kis.close()
 
 
@@ -114,8 +116,6 @@ def _persist_sell(order: SellOrder, result: SellResult) -> None:
 
 def _lookup_buy_strategy(session: Session, stock_code: str) -> str | None:
     """해당 종목의 가장 최근 BUY 로그에서 strategy_signal 조회."""
-    from sqlmodel import text
-
     row = session.exec(
         text(
             "SELECT strategy_signal FROM trade_logs "
@@ -126,7 +126,7 @@ def _lookup_buy_strategy(session: Session, stock_code: str) -> str | None:
     return row[0] if row else None
 
 
-def _notify_sell(order: SellOrder, result: SellResult, notifier: TypedStreamPublisher) -> None:
+def _notify_sell(order: SellOrder, result: SellResult, notifier: BackgroundStreamPublisher[TradeNotification]) -> None:
     """매도 체결 알림 발행 (fire-and-forget)."""
     try:
         notification = TradeNotification(
@@ -26,6 +26,11 @@ STREAM_TRADE_NOTIFICATIONS = "stream:trade-notifications"
 GROUP_TELEGRAM = "group_telegram"
 KEY_MUTE_UNTIL = "notification:mute_until"
 
+# 체결 알림 공통 본문 (종목/수량/금액) — 선택 항목은 _format_trade_message에서 덧붙임
+_TRADE_BODY_TMPL = "{stock_name} ({stock_code})\n수량: {quantity}주 | 가격: {price:,}원\n금액: {total_amount:,}원"
+_BUY_TMPL = "<b>[매수 체결]</b>\n" + _TRADE_BODY_TMPL
+_SELL_TMPL = "<b>[매도 체결]</b>\n" + _TRADE_BODY_TMPL
+
 _bot: TelegramBot | None = None
 _handler: CommandHandler | None = None
 _polling_thread: threading.Thread | None = None
@@ -33,6 +38,11 @@ _polling_active = threading.Event()
 _notification_consumer: TypedStreamConsumer | None = None
 _notification_thread: threading.Thread | None = None
 
+# 음소거 여부 프로세스 내 캐시: (다음 확인 시각 monotonic ns, 결과)
+_MUTE_CHECK_INTERVAL_NS = 5_000_000_000
+_MUTE_COMMANDS = frozenset({"/mute", "/unmute"})
+_mute_cache: tuple[int, bool] = (0, False)
+
 
 def _get_bot() -> TelegramBot:
     global _bot
@@ -64,42 +74,48 @@ def _get_handler() -> CommandHandler:
 
 
 def _is_muted() -> bool:
-    """음소거 상태 확인."""
+    """음소거 상태 확인 — 키 TTL 기준 (-2: 없음).
+
+    TTL 없이(-1) 저장된 구버전 키는 저장된 해제 시각(epoch 초)과 비교.
+    Redis 조회 결과를 _MUTE_CHECK_INTERVAL_NS 동안 재사용.
+    """
+    global _mute_cache
+    now = time.monotonic_ns()
+    if now < _mute_cache[0]:
+        return _mute_cache[1]
     try:
         redis_client = get_redis()
-        mute_until = redis_client.get(KEY_MUTE_UNTIL)
-        if mute_until:
-            return int(mute_until) > int(time.time())
+        ttl = int(redis_client.pttl(KEY_MUTE_UNTIL))
+        if ttl == -1:
+            mute_until = redis_client.get(KEY_MUTE_UNTIL)
+            muted = bool(mute_until) and int(mute_until) > int(time.time())
+        else:
+            muted = ttl > 0
     except Exception:
-        pass
-    return False
+        return False
+    _mute_cache = (now + _MUTE_CHECK_INTERVAL_NS, muted)
+    return muted
+
+
+def _invalidate_mute_cache(command: str | None) -> None:
+    """/mute, /unmute 처리 직후 다음 알림에서 Redis 재확인."""
+    global _mute_cache
+    if command in _MUTE_COMMANDS:
+        _mute_cache = (0, False)
 
 
 def _format_trade_message(n: TradeNotification) -> str:
     """체결 알림 메시지 포매팅 (HTML)."""
+    fields = n.__dict__
     if n.trade_type == "BUY":
-        lines = [
-            "<b>[매수 체결]</b>",
-            f"{n.stock_name} ({n.stock_code})",
-            f"수량: {n.quantity}주 | 가격: {n.price:,}원",
-            f"금액: {n.total_amount:,}원",
-        ]
-        parts = []
-        if n.signal_type:
-            parts.append(n.signal_type)
-        if n.trade_tier:
-            parts.append(n.trade_tier)
+        lines = [_BUY_TMPL.format_map(fields)]
+        parts = [p for p in (n.signal_type, n.trade_tier) if p]
         if parts:
             lines.append(f"전략: {' / '.join(parts)}")
         if n.hybrid_score is not None:
             lines.append(f"점수: {n.hybrid_score:.1f}")
     else:
-        lines = [
-            "<b>[매도 체결]</b>",
-            f"{n.stock_name} ({n.stock_code})",
-            f"수량: {n.quantity}주 | 가격: {n.price:,}원",
-            f"금액: {n.total_amount:,}원",
-        ]
+        lines = [_SELL_TMPL.format_map(fields)]
         if n.profit_pct is not None:
             lines.append(f"수익률: {n.profit_pct:+.2f}%")
         if n.sell_reason:
@@ -142,6 +158,7 @@ def _poll_loop(bot: TelegramBot, handler: CommandHandler) -> None:
                     chat_id=cmd["chat_id"],
                     username=cmd["username"],
                 )
+                _invalidate_mute_cache(cmd["command"])
                 bot.send_message(cmd["chat_id"], response)
         except Exception:
             logger.exception("Polling loop error")
@@ -255,6 +272,7 @@ def manual_poll():
             chat_id=cmd["chat_id"],
             username=cmd["username"],
         )
+        _invalidate_mute_cache(cmd["command"])
         bot.send_message(cmd["chat_id"], response)
         results.append({"command": cmd["command"], "response": response[:100]})
 
@@ -513,9 +513,12 @@ class CommandHandler:
             minutes = int(args.strip())
         except (ValueError, TypeError):
             return "사용법: `/mute 분` (예: /mute 30)"
+        if minutes <= 0:
+            return "사용법: `/mute 분` (예: /mute 30)"
 
+        # 만료는 Redis TTL로 관리 (값은 /config 남은 시간 표시용)
         until = int(time.time()) + minutes * 60
-        self._redis.set(KEY_MUTE_UNTIL, str(until))
+        self._redis.set(KEY_MUTE_UNTIL, str(until), ex=minutes * 60)
         return f"알림을 {minutes}분간 음소거합니다."
 
     def _handle_unmute(self, args: str, **kwargs) -> str:
@@ -25,7 +25,7 @@ from prime_jennie.domain.enums import (
 from prime_jennie.domain.trading import BuySignal, SellOrder
 from prime_jennie.infra.database.engine import get_engine
 from prime_jennie.infra.database.models import StockMasterDB
-from prime_jennie.infra.kis.client import KISClient
+from prime_jennie.infra.kis.client import KISClient, clear_daily_prices_cache
 from prime_jennie.services.buyer.executor import BuyExecutor
 from prime_jennie.services.buyer.portfolio_guard import PortfolioGuard
 from prime_jennie.services.seller.executor import SellExecutor
@@ -91,6 +91,7 @@ def mock_gateway_state() -> GatewayState:
 @pytest.fixture
 def mock_kis_client(mock_gateway_state: GatewayState) -> KISClient:
     """MockTransport 기반 KISClient (네트워크 없음)."""
+    clear_daily_prices_cache()
     transport = create_mock_transport(mock_gateway_state)
 
     client = KISClient.__new__(KISClient)
@@ -82,6 +82,9 @@ def create_mock_transport(state: GatewayState) -> httpx.MockTransport:
         if path == "/api/market/daily-prices" and method == "POST":
             return _handle_daily_prices(state, payload)
 
+        if path == "/api/market/daily-prices/bulk" and method == "POST":
+            return _handle_daily_prices_bulk(state, payload)
+
         if path == "/api/market/minute-prices" and method == "POST":
             return _json_response([])
 
@@ -179,6 +182,17 @@ def _handle_snapshot(state: GatewayState, payload: dict) -> httpx.Response:
     )
 
 
+def _handle_daily_prices_bulk(state: GatewayState, payload: dict) -> httpx.Response:
+    """일봉 일괄 조회 — 종목별 단건 응답을 묶어서 반환."""
+    days = payload.get("days", 30)
+    return _json_response(
+        {
+            code: _handle_daily_prices(state, {"stock_code": code, "days": days}).json()
+            for code in payload.get("stock_codes", [])
+        }
+    )
+
+
 def _handle_daily_prices(state: GatewayState, payload: dict) -> httpx.Response:
     """일봉 데이터."""
     code = payload.get("stock_code", "")
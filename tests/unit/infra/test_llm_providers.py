@@ -212,14 +212,12 @@ class TestClaudeProvider:
         assert p.provider_name == "claude"
 
     @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"})
-    def test_embeddings_not_supported(self):
+    async def test_embeddings_not_supported(self):
         from prime_jennie.infra.llm.providers.claude import ClaudeLLMProvider
 
         p = ClaudeLLMProvider()
         with pytest.raises(NotImplementedError):
-            import asyncio
-
-            asyncio.get_event_loop().run_until_complete(p.generate_embeddings(["test"]))
+            await p.generate_embeddings(["test"])
 
 
 # ─── CloudFailover Provider ──────────────────────────────────
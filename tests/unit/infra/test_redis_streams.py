@@ -0,0 +1,98 @@
+"""TypedStreamPublisher / BackgroundStreamPublisher 단위 테스트."""
+
+import threading
+import time
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+import fakeredis
+import pytest
+
+from prime_jennie.domain.notification import TradeNotification
+from prime_jennie.infra.redis.streams import BackgroundStreamPublisher, TypedStreamPublisher
+
+_STREAM = "stream:test-notifications"
+
+
+def _make_notification(quantity: int = 10) -> TradeNotification:
+    return TradeNotification(
+        trade_type="BUY",
+        stock_code="005930",
+        stock_name="삼성전자",
+        quantity=quantity,
+        price=70000,
+        total_amount=quantity * 70000,
+        timestamp=datetime(2026, 2, 21, 9, 30, tzinfo=UTC),
+    )
+
+
+@pytest.fixture
+def fake_redis():
+    r = fakeredis.FakeRedis(version=(7,), decode_responses=True)
+    yield r
+    r.flushall()
+    r.close()
+
+
+def _read_quantities(client) -> list[int]:
+    return [TradeNotification.model_validate_json(data["payload"]).quantity for _, data in client.xrange(_STREAM)]
+
+
+class TestTypedStreamPublisher:
+    def test_publish_many_single_pipeline(self, fake_redis):
+        publisher = TypedStreamPublisher(fake_redis, _STREAM, TradeNotification)
+
+        ids = publisher.publish_many([_make_notification(q) for q in (1, 2, 3)])
+
+        assert len(ids) == 3
+        assert _read_quantities(fake_redis) == [1, 2, 3]
+
+
+class TestBackgroundStreamPublisher:
+    def test_stop_flushes_queued_messages(self, fake_redis):
+        publisher = BackgroundStreamPublisher(fake_redis, _STREAM, TradeNotification, batch_size=2)
+        publisher.start()
+        for q in range(1, 6):
+            publisher.publish(_make_notification(q))
+        publisher.stop()
+
+        assert _read_quantities(fake_redis) == [1, 2, 3, 4, 5]
+
+    def test_full_queue_drops_without_raising(self, fake_redis):
+        publisher = BackgroundStreamPublisher(fake_redis, _STREAM, TradeNotification, max_queue=1)
+        publisher.publish(_make_notification(1))
+        publisher.publish(_make_notification(2))  # 스레드 미시작 → 큐 가득 참
+
+        publisher.start()
+        publisher.stop()
+        assert _read_quantities(fake_redis) == [1]
+
+    def test_publish_error_keeps_worker_alive(self):
+        client = MagicMock()
+        client.pipeline.return_value.execute.side_effect = [Exception("Redis down"), ["1-0"]]
+        publisher = BackgroundStreamPublisher(client, _STREAM, TradeNotification, batch_size=1)
+        publisher.publish(_make_notification(1))
+        publisher.publish(_make_notification(2))
+
+        publisher.start()
+        publisher.stop()
+        assert client.pipeline.return_value.execute.call_count == 2
+
+    def test_stop_bounded_when_queue_full_and_redis_stuck(self):
+        release = threading.Event()
+        client = MagicMock()
+        client.pipeline.return_value.execute.side_effect = lambda: release.wait(5) and ["1-0"]
+        publisher = BackgroundStreamPublisher(client, _STREAM, TradeNotification, max_queue=1, batch_size=1)
+        publisher.start()
+        publisher.publish(_make_notification(1))  # 워커가 꺼내서 execute에서 대기
+        deadline = time.monotonic() + 2
+        while client.pipeline.return_value.execute.call_count == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        publisher.publish(_make_notification(2))  # 큐 가득 참
+
+        started = time.monotonic()
+        publisher.stop(timeout=0.2)
+        elapsed = time.monotonic() - started
+        release.set()
+
+        assert elapsed < 1.0
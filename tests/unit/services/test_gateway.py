@@ -1,8 +1,9 @@
 """KIS Gateway 서비스 단위 테스트."""
 
+import asyncio
 import sys
 from datetime import UTC, date, datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -110,6 +111,76 @@ class TestDailyPrices:
         assert len(data) == 1
         assert data[0]["stock_code"] == "005930"
 
+    def test_bulk_returns_prices_per_code(self, client, mock_circuit_breaker):
+        mock_circuit_breaker.call.side_effect = lambda fn, code, days: [
+            DailyPrice(
+                stock_code=code,
+                price_date=date(2026, 2, 18),
+                open_price=71000,
+                high_price=72000,
+                low_price=70500,
+                close_price=71800,
+                volume=10000000,
+            )
+        ]
+
+        resp = client.post(
+            "/api/market/daily-prices/bulk",
+            json={"stock_codes": ["005930", "000660", "005930"], "days": 5},
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert list(data) == ["005930", "000660"]  # 중복 제거, 순서 유지
+        assert data["000660"][0]["stock_code"] == "000660"
+        assert mock_circuit_breaker.call.call_count == 2
+
+    def test_bulk_charges_rate_limit_per_code(self, client, mock_circuit_breaker):
+        mock_circuit_breaker.call.return_value = []
+        gw = _get_gateway_module()
+
+        with patch.object(gw, "_acquire_daily_prices_slot", new=AsyncMock()) as acquire:
+            resp = client.post("/api/market/daily-prices/bulk", json={"stock_codes": ["005930", "000660", "035420"]})
+
+        assert resp.status_code == 200
+        assert acquire.await_count == 3
+
+    def test_bulk_omits_failed_code(self, client, mock_circuit_breaker):
+        def _call(fn, code, days):
+            if code == "000660":
+                raise RuntimeError("boom")
+            return []
+
+        mock_circuit_breaker.call.side_effect = _call
+
+        resp = client.post("/api/market/daily-prices/bulk", json={"stock_codes": ["005930", "000660"]})
+        assert resp.status_code == 200
+        assert resp.json() == {"005930": []}
+
+    def test_bulk_fetches_off_event_loop(self, client, mock_circuit_breaker):
+        """종목별 블로킹 KIS 호출은 스레드풀에서 실행 (이벤트 루프 점유 X)."""
+        on_loop: list[bool] = []
+
+        def _call(fn, code, days):
+            try:
+                asyncio.get_running_loop()
+                on_loop.append(True)
+            except RuntimeError:
+                on_loop.append(False)
+            return []
+
+        mock_circuit_breaker.call.side_effect = _call
+
+        resp = client.post("/api/market/daily-prices/bulk", json={"stock_codes": ["005930", "000660"]})
+        assert resp.status_code == 200
+        assert on_loop == [False, False]
+
+    def test_bulk_rejects_too_many_codes(self, client):
+        gw = _get_gateway_module()
+        codes = [f"{i:06d}" for i in range(gw.DAILY_PRICES_BULK_MAX + 1)]
+
+        resp = client.post("/api/market/daily-prices/bulk", json={"stock_codes": codes})
+        assert resp.status_code == 422
+
 
 class TestTradingEndpoints:
     """Trading 엔드포인트 테스트."""
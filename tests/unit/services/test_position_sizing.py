@@ -126,6 +126,12 @@ class TestCalculateATR:
     def test_empty_prices(self):
         assert calculate_atr([]) == 0.0
 
+    def test_uses_recent_period_only(self):
+        # 앞쪽 변동성 큰 구간은 period 밖이므로 무시
+        wide = [{"high": 200, "low": 0, "close": 100}] * 5
+        narrow = [{"high": 105, "low": 95, "close": 100}] * 3
+        assert calculate_atr(wide + narrow, period=3) == 10.0
+
 
 class TestClampATR:
     def test_normal_range(self):
@@ -181,22 +187,17 @@ class TestCalculatePositionSize:
 
         assert result_stale.quantity <= result_fresh.quantity
 
-    def test_no_cash(self):
-        """현금 없으면 0수량."""
-        request = _make_request(available_cash=0, portfolio_value=0)
-        result = calculate_position_size(request)
-        assert result.quantity == 0
-
-    def test_zero_atr(self):
-        """ATR 0이면 0수량."""
-        request = _make_request(atr=0)
-        result = calculate_position_size(request)
-        assert result.quantity == 0
-
-    def test_blocked_tier_zero(self):
-        """BLOCKED 티어 → 0수량."""
-        request = _make_request(trade_tier=TradeTier.BLOCKED)
-        result = calculate_position_size(request)
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            pytest.param({"available_cash": 0, "portfolio_value": 0}, id="no_cash"),
+            pytest.param({"atr": 0}, id="zero_atr"),
+            pytest.param({"trade_tier": TradeTier.BLOCKED}, id="blocked_tier"),
+        ],
+    )
+    def test_zero_quantity(self, overrides: dict):
+        """현금 없음 / ATR 0 / BLOCKED 티어 → 0수량."""
+        result = calculate_position_size(_make_request(**overrides))
         assert result.quantity == 0
 
     def test_sector_discount_applied(self):
@@ -2,6 +2,8 @@
 
 import time
 from datetime import UTC, datetime
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
 
 import fakeredis
 import pytest
@@ -24,6 +26,7 @@ from prime_jennie.services.scanner.risk_gates import (
     check_stoploss_cooldown,
     check_strategy_alignment,
     check_trade_tier,
+    run_all_gates,
 )
 
 
@@ -35,7 +38,7 @@ def fake_redis():
 
 
 def _make_bar(close: float = 100, open: float = 99, high: float = 101, low: float = 98, volume: int = 1000) -> Bar:
-    return Bar(timestamp=1000.0, open=open, high=high, low=low, close=close, volume=volume)
+    return Bar.model_construct(timestamp=1000.0, open=open, high=high, low=low, close=close, volume=volume)
 
 
 def _make_bars(n: int = 20) -> list[Bar]:
@@ -303,3 +306,38 @@ class TestStrategyAlignment:
         assert not check_strategy_alignment("MOMENTUM", ctx).passed
         assert not check_strategy_alignment("DIP_BUY", ctx).passed
         assert check_strategy_alignment("GOLDEN_CROSS", ctx).passed
+
+
+class TestRunAllGates:
+    def _run(self, bars: list[Bar], trade_tier: TradeTier = TradeTier.TIER1):
+        # 10:30 KST — 장초 노이즈/위험 구간 밖
+        kst_1030 = datetime(2026, 2, 19, 10, 30, tzinfo=ZoneInfo("Asia/Seoul"))
+        with patch("prime_jennie.services.scanner.risk_gates._kst_now", return_value=kst_1030):
+            return run_all_gates(
+                "005930",
+                bars,
+                current_price=100.0,
+                rsi=55.0,
+                volume_ratio=1.0,
+                vwap=100.0,
+                trade_tier=trade_tier,
+                context=_make_context(),
+                config=_make_config(),
+                last_signal_times={},
+            )
+
+    def test_all_pass(self):
+        result = self._run(_make_bars(20))
+        assert result.passed
+        assert result.gate_name == "all_gates"
+
+    def test_first_failure_returned(self):
+        """첫 실패 게이트에서 중단 — 이후 게이트 결과는 반환되지 않음."""
+        result = self._run(_make_bars(5), trade_tier=TradeTier.BLOCKED)
+        assert not result.passed
+        assert result.gate_name == "min_bars"
+
+    def test_late_gate_failure(self):
+        result = self._run(_make_bars(20), trade_tier=TradeTier.BLOCKED)
+        assert not result.passed
+        assert result.gate_name == "trade_tier"
@@ -56,28 +56,25 @@ def _make_prices(n: int = 150, base: int = 70000, trend: float = 0.001) -> list:
 NOW = datetime(2026, 2, 19, 10, 0, 0, tzinfo=UTC)
 
 
+# momentum, quality, value, technical, news (나머지는 supply_demand)
+_SUBSCORE_BASES = (12.0, 10.0, 12.0, 8.0, 7.0)
+
+
 def _quant(code: str = "005930", total: float = 60.0) -> QuantScore:
     # subscores가 total에 맞도록 비례 조정
     base_sum = 60.0  # 12+10+12+8+7+11
     ratio = total / base_sum if base_sum > 0 else 1.0
-    return QuantScore(
+    momentum, quality, value, technical, news = (round(base * ratio, 1) for base in _SUBSCORE_BASES)
+    return QuantScore.model_construct(
         stock_code=code,
         stock_name="삼성전자",
         total_score=total,
-        momentum_score=round(12.0 * ratio, 1),
-        quality_score=round(10.0 * ratio, 1),
-        value_score=round(12.0 * ratio, 1),
-        technical_score=round(8.0 * ratio, 1),
-        news_score=round(7.0 * ratio, 1),
-        supply_demand_score=round(
-            total
-            - round(12.0 * ratio, 1)
-            - round(10.0 * ratio, 1)
-            - round(12.0 * ratio, 1)
-            - round(8.0 * ratio, 1)
-            - round(7.0 * ratio, 1),
-            1,
-        ),
+        momentum_score=momentum,
+        quality_score=quality,
+        value_score=value,
+        technical_score=technical,
+        news_score=news,
+        supply_demand_score=round(total - (momentum + quality + value + technical + news), 1),
     )
 
 
@@ -1,8 +1,11 @@
 """Scout _save_watchlist_to_db 단위 테스트."""
 
-from datetime import UTC, datetime
+import importlib
+from datetime import UTC, date, datetime
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from prime_jennie.domain.enums import (
     MarketRegime,
     RiskTag,
@@ -13,11 +16,24 @@ from prime_jennie.domain.watchlist import HotWatchlist, WatchlistEntry
 from prime_jennie.infra.database.models import WatchlistHistoryDB
 from prime_jennie.services.scout.app import _save_watchlist_to_db
 
+# 패키지 __init__ 의 FastAPI `app` 이 서브모듈 이름을 가리므로 모듈 객체를 직접 가져온다
+scout_app_module = importlib.import_module("prime_jennie.services.scout.app")
+
 NOW = datetime(2026, 2, 25, 10, 0, 0, tzinfo=UTC)
+TODAY = date(2026, 2, 25)
+
+
+class _FakeDate:
+    """date.today()만 고정 — 실제 date 비교는 그대로 C 구현을 사용."""
+
+    @staticmethod
+    def today() -> date:
+        return TODAY
 
 
 def _make_watchlist(entries: list[WatchlistEntry], regime: MarketRegime = MarketRegime.SIDEWAYS) -> HotWatchlist:
-    return HotWatchlist(
+    # 고정된 테스트 입력 — pydantic 검증 생략
+    return HotWatchlist.model_construct(
         generated_at=NOW,
         market_regime=regime,
         stocks=entries,
@@ -36,7 +52,7 @@ def _make_entry(
     risk_tag: RiskTag = RiskTag.NEUTRAL,
     trade_tier: TradeTier = TradeTier.TIER1,
 ) -> WatchlistEntry:
-    return WatchlistEntry(
+    return WatchlistEntry.model_construct(
         stock_code=code,
         stock_name=name,
         quant_score=quant_score,
@@ -57,13 +73,13 @@ def _make_entry(
 class TestSaveWatchlistToDb:
     """_save_watchlist_to_db 컬럼 매핑 검증."""
 
+    @pytest.fixture(autouse=True)
+    def _freeze_today(self, monkeypatch):
+        monkeypatch.setattr(scout_app_module, "date", _FakeDate)
+
     @patch("prime_jennie.services.scout.app.WatchlistRepository")
-    @patch("prime_jennie.services.scout.app.date")
-    def test_new_columns_mapped(self, mock_date, mock_repo):
+    def test_new_columns_mapped(self, mock_repo):
         """quant_score, sector_group, market_regime, run_id 이 DB 엔트리에 매핑되는지 확인."""
-        mock_date.today.return_value = mock_date
-        mock_date.__eq__ = lambda self, other: True
-
         session = MagicMock()
         entry = _make_entry(
             quant_score=72.5,
@@ -78,6 +94,7 @@ class TestSaveWatchlistToDb:
         call_args = mock_repo.save_history.call_args
         _session, _date, _run_id, entries = call_args[0]
 
+        assert _date == TODAY
         assert _run_id == "scout-20260225-0300"
         assert len(entries) == 1
         db_entry: WatchlistHistoryDB = entries[0]
@@ -88,12 +105,8 @@ class TestSaveWatchlistToDb:
         assert db_entry.is_active is True
 
     @patch("prime_jennie.services.scout.app.WatchlistRepository")
-    @patch("prime_jennie.services.scout.app.date")
-    def test_none_sector_group(self, mock_date, mock_repo):
+    def test_none_sector_group(self, mock_repo):
         """sector_group이 None일 때 DB에 None으로 저장."""
-        mock_date.today.return_value = mock_date
-        mock_date.__eq__ = lambda self, other: True
-
         session = MagicMock()
         entry = _make_entry(sector_group=None)
         watchlist = _make_watchlist([entry])
@@ -106,12 +119,8 @@ class TestSaveWatchlistToDb:
         assert db_entry.market_regime == "SIDEWAYS"
 
     @patch("prime_jennie.services.scout.app.WatchlistRepository")
-    @patch("prime_jennie.services.scout.app.date")
-    def test_db_error_triggers_rollback(self, mock_date, mock_repo):
+    def test_db_error_triggers_rollback(self, mock_repo):
         """DB 저장 실패 시 session.rollback() 호출 확인."""
-        mock_date.today.return_value = mock_date
-        mock_date.__eq__ = lambda self, other: True
-
         session = MagicMock()
         mock_repo.save_history.side_effect = RuntimeError("DB error")
 
@@ -123,12 +132,8 @@ class TestSaveWatchlistToDb:
         session.rollback.assert_called_once()
 
     @patch("prime_jennie.services.scout.app.WatchlistRepository")
-    @patch("prime_jennie.services.scout.app.date")
-    def test_multiple_entries_all_mapped(self, mock_date, mock_repo):
+    def test_multiple_entries_all_mapped(self, mock_repo):
         """여러 종목의 컬럼이 모두 올바르게 매핑되는지 확인."""
-        mock_date.today.return_value = mock_date
-        mock_date.__eq__ = lambda self, other: True
-
         session = MagicMock()
         entries = [
             _make_entry(code="005930", rank=1, sector_group=SectorGroup.SEMICONDUCTOR_IT),
@@ -149,12 +154,8 @@ class TestSaveWatchlistToDb:
         assert all(e.run_id == "scout-20260225-0300" for e in db_entries)
 
     @patch("prime_jennie.services.scout.app.WatchlistRepository")
-    @patch("prime_jennie.services.scout.app.date")
-    def test_test_source_sets_inactive(self, mock_date, mock_repo):
+    def test_test_source_sets_inactive(self, mock_repo):
         """source=test일 때 is_active=False로 저장."""
-        mock_date.today.return_value = mock_date
-        mock_date.__eq__ = lambda self, other: True
-
         session = MagicMock()
         watchlist = _make_watchlist([_make_entry()])
 
@@ -1,6 +1,10 @@
 """Scout Quant Scorer v2 단위 테스트."""
 
 from datetime import UTC, date, datetime
+from functools import cache, lru_cache
+
+import numpy as np
+import pytest
 
 from prime_jennie.domain.enums import MarketRegime, SectorGroup
 from prime_jennie.domain.scoring import QuantScore
@@ -12,7 +16,6 @@ from prime_jennie.services.scout.enrichment import (
 )
 from prime_jennie.services.scout.quant import (
     V2_NEUTRAL,
-    _compute_rsi,
     _linear_map,
     _momentum_score,
     _news_score,
@@ -26,9 +29,13 @@ from prime_jennie.services.scout.quant import (
 
 # ─── Fixtures ────────────────────────────────────────────────────
 
+_FIXED_TS = datetime(2026, 2, 19, 9, 0, tzinfo=UTC)
+
 
+@cache
 def _make_master(code: str = "005930", name: str = "삼성전자") -> StockMaster:
-    return StockMaster(
+    """종목 마스터 (읽기 전용으로만 쓰이므로 인자별로 공유)."""
+    return StockMaster.model_construct(
         stock_code=code,
         stock_name=name,
         market="KOSPI",
@@ -36,23 +43,28 @@ def _make_master(code: str = "005930", name: str = "삼성전자") -> StockMaste
     )
 
 
-def _make_prices(n: int = 150, base: int = 70000, trend: float = 0.001) -> list[DailyPrice]:
-    """n일치 일봉 생성 (상승 추세)."""
-    prices = []
-    for i in range(n):
-        price = int(base * (1 + trend * i))
-        prices.append(
-            DailyPrice(
-                stock_code="005930",
-                price_date=date(2026, 2, 19),
-                open_price=price - 200,
-                high_price=price + 300,
-                low_price=price - 400,
-                close_price=price,
-                volume=10000000 + i * 10000,
-            )
+@lru_cache(maxsize=32)
+def _cached_prices(n: int, base: int, trend: float) -> tuple[DailyPrice, ...]:
+    i = np.arange(n)
+    close = (base * (1 + trend * i)).astype(np.int64)
+    volume = 10000000 + i * 10000
+    return tuple(
+        DailyPrice.model_construct(
+            stock_code="005930",
+            price_date=date(2026, 2, 19),
+            open_price=price - 200,
+            high_price=price + 300,
+            low_price=price - 400,
+            close_price=price,
+            volume=vol,
         )
-    return prices
+        for price, vol in zip(close.tolist(), volume.tolist(), strict=True)
+    )
+
+
+def _make_prices(n: int = 150, base: int = 70000, trend: float = 0.001) -> list[DailyPrice]:
+    """n일치 일봉 생성 (상승 추세). 같은 인자는 캐시된 일봉을 새 리스트로 반환."""
+    return list(_cached_prices(n, base, trend))
 
 
 def _make_candidate(
@@ -72,18 +84,29 @@ def _make_candidate(
     )
 
 
+@pytest.fixture(scope="module")
+def uptrend_candidate() -> EnrichedCandidate:
+    """150일 상승 추세 + 재무/수급/뉴스가 모두 채워진 후보 (읽기 전용으로 공유)."""
+    return _make_candidate(
+        prices=_make_prices(150),
+        ft=FinancialTrend(per=12.0, pbr=1.5, roe=12.0),
+        it=InvestorTradingSummary(foreign_net_buy_sum=1e9, institution_net_buy_sum=5e8),
+        news_avg=60.0,
+    )
+
+
+@pytest.fixture(scope="module")
+def uptrend_score(uptrend_candidate) -> QuantScore:
+    """uptrend_candidate 채점 결과 — score_candidate는 순수 함수라 한 번만 계산."""
+    return score_candidate(uptrend_candidate)
+
+
 # ─── Total Score ─────────────────────────────────────────────────
 
 
 class TestScoreCandidate:
-    def test_valid_score_has_six_subscores(self):
-        candidate = _make_candidate(
-            prices=_make_prices(150),
-            ft=FinancialTrend(per=12.0, pbr=1.5, roe=12.0),
-            it=InvestorTradingSummary(foreign_net_buy_sum=1e9, institution_net_buy_sum=5e8),
-            news_avg=60.0,
-        )
-        result = score_candidate(candidate)
+    def test_valid_score_has_six_subscores(self, uptrend_score):
+        result = uptrend_score
 
         assert isinstance(result, QuantScore)
         assert 0 <= result.total_score <= 100
@@ -135,7 +158,7 @@ class TestScoreCandidate:
                 price=80000,
                 high_52w=90000,
                 low_52w=50000,
-                timestamp=datetime.now(UTC),
+                timestamp=_FIXED_TS,
             ),
         )
         result = score_candidate(candidate)
@@ -151,6 +174,12 @@ class TestScoreCandidate:
         sideways = score_candidate(candidate, market_regime=MarketRegime.SIDEWAYS)
         assert bull.total_score >= sideways.total_score
 
+        # 국면은 모멘텀에만 영향 → 나머지 서브스코어는 동일, 총점 차이 = 모멘텀 차이
+        regime_independent = {"quality_score", "value_score", "technical_score", "news_score", "supply_demand_score"}
+        assert bull.model_dump(include=regime_independent) == sideways.model_dump(include=regime_independent)
+        momentum_delta = bull.momentum_score - sideways.momentum_score
+        assert bull.total_score - sideways.total_score == pytest.approx(momentum_delta, abs=0.2)
+
 
 # ─── Sub-factors ─────────────────────────────────────────────────
 
@@ -236,17 +265,18 @@ class TestNewsScore:
 
 
 class TestSectorMomentumScore:
-    def test_hot_sector_high_score(self):
-        candidate = _make_candidate()
-        candidate.sector_avg_return_20d = 15.0  # HOT 섹터
-        result = _sector_momentum_score(candidate)
-        assert result >= 9.5
-
-    def test_cool_sector_low_score(self):
+    @pytest.mark.parametrize(
+        ("sector_return", "low", "high"),
+        [
+            pytest.param(15.0, 9.5, 10.0, id="hot_sector"),
+            pytest.param(-5.0, 0.0, 0.5, id="cool_sector"),
+            pytest.param(5.0, 4.0, 6.0, id="moderate_sector"),
+        ],
+    )
+    def test_score_range(self, sector_return: float, low: float, high: float):
         candidate = _make_candidate()
-        candidate.sector_avg_return_20d = -5.0  # COOL 섹터
-        result = _sector_momentum_score(candidate)
-        assert result <= 0.5
+        candidate.sector_avg_return_20d = sector_return
+        assert low <= _sector_momentum_score(candidate) <= high
 
     def test_none_returns_neutral(self):
         candidate = _make_candidate()
@@ -254,12 +284,6 @@ class TestSectorMomentumScore:
         result = _sector_momentum_score(candidate)
         assert result == V2_NEUTRAL["sector_momentum"]
 
-    def test_moderate_sector(self):
-        candidate = _make_candidate()
-        candidate.sector_avg_return_20d = 5.0  # 중간
-        result = _sector_momentum_score(candidate)
-        assert 4.0 <= result <= 6.0
-
 
 class TestSupplyDemandScore:
     def test_strong_foreign_buying_high_score(self):
@@ -288,29 +312,14 @@ class TestSupplyDemandScore:
 # ─── Helpers ─────────────────────────────────────────────────────
 
 
-class TestComputeRSI:
-    def test_uptrend_rsi_above_50(self):
-        closes = [100 + i for i in range(30)]
-        rsi = _compute_rsi(closes)
-        assert rsi is not None
-        assert rsi > 50
-
-    def test_downtrend_rsi_below_50(self):
-        closes = [200 - i for i in range(30)]
-        rsi = _compute_rsi(closes)
-        assert rsi is not None
-        assert rsi < 50
-
-    def test_insufficient_data_returns_none(self):
-        assert _compute_rsi([100, 101, 102]) is None
-
-
 class TestLinearMap:
-    def test_midpoint(self):
-        assert _linear_map(50, 0, 100, 0, 10) == 5.0
-
-    def test_clamped_below(self):
-        assert _linear_map(-10, 0, 100, 0, 10) == 0.0
-
-    def test_clamped_above(self):
-        assert _linear_map(200, 0, 100, 0, 10) == 10.0
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            pytest.param(50, 5.0, id="midpoint"),
+            pytest.param(-10, 0.0, id="clamped_below"),
+            pytest.param(200, 10.0, id="clamped_above"),
+        ],
+    )
+    def test_linear_map(self, value: float, expected: float):
+        assert _linear_map(value, 0, 100, 0, 10) == expected
@@ -1,18 +1,27 @@
 """Scout RAG Retriever 단위 테스트."""
 
-from unittest.mock import MagicMock, patch
+import sys
+from functools import cache
+from unittest.mock import patch
 
 from prime_jennie.domain.enums import SectorGroup
 from prime_jennie.domain.macro import TradingContext
 from prime_jennie.domain.scoring import QuantScore
 from prime_jennie.domain.stock import StockMaster
+from prime_jennie.services.scout.analyst import _build_prompt
 from prime_jennie.services.scout.enrichment import EnrichedCandidate
+from prime_jennie.services.scout.rag_retriever import (
+    discover_rag_candidates,
+    fetch_news_for_stocks,
+    init_vectorstore,
+)
 
 # ─── Fixtures ────────────────────────────────────────────────────
 
 
+@cache
 def _make_master(code: str = "005930", name: str = "삼성전자", sector=SectorGroup.SEMICONDUCTOR_IT):
-    return StockMaster(
+    return StockMaster.model_construct(
         stock_code=code,
         stock_name=name,
         market="KOSPI",
@@ -25,12 +34,28 @@ def _make_enriched(code: str = "005930", name: str = "삼성전자", sector=Sect
     return EnrichedCandidate(master=_make_master(code, name, sector))
 
 
-def _make_doc(content: str, stock_code: str = "005930", created_at_utc: int = 9999999999):
-    """Mock LangChain Document."""
-    doc = MagicMock()
-    doc.page_content = content
-    doc.metadata = {"stock_code": stock_code, "created_at_utc": created_at_utc}
-    return doc
+class _Doc:
+    """LangChain Document 대역 (page_content/metadata만 사용)."""
+
+    __slots__ = ("page_content", "metadata")
+
+    def __init__(self, page_content: str, metadata: dict):
+        self.page_content = page_content
+        self.metadata = metadata
+
+
+def _make_doc(content: str, stock_code: str = "005930", created_at_utc: int = 9999999999) -> _Doc:
+    return _Doc(content, {"stock_code": stock_code, "created_at_utc": created_at_utc})
+
+
+class _FakeVectorStore:
+    """similarity_search 호출마다 준비된 결과를 순서대로 반환 (소진 시 빈 리스트)."""
+
+    def __init__(self, responses: list[list] | None = None):
+        self._responses = iter(responses or [])
+
+    def similarity_search(self, *args, **kwargs) -> list:
+        return next(self._responses, [])
 
 
 # ─── init_vectorstore ────────────────────────────────────────────
@@ -40,30 +65,17 @@ def test_init_vectorstore_disabled():
     """enable_news_analysis=False → None 반환."""
     with patch("prime_jennie.services.scout.rag_retriever.get_config") as mock_config:
         mock_config.return_value.scout.enable_news_analysis = False
-        from prime_jennie.services.scout.rag_retriever import init_vectorstore
-
         result = init_vectorstore()
         assert result is None
 
 
-def test_init_vectorstore_import_error():
+def test_init_vectorstore_import_error(monkeypatch):
     """langchain 미설치 → None 반환 (파이프라인 중단 없음)."""
-    import builtins
+    # sys.modules 항목이 None이면 import 시 ImportError 발생
+    monkeypatch.setitem(sys.modules, "langchain_qdrant", None)
 
-    original_import = builtins.__import__
-
-    def mock_import(name, *args, **kwargs):
-        if "langchain_qdrant" in name:
-            raise ImportError("No module named 'langchain_qdrant'")
-        return original_import(name, *args, **kwargs)
-
-    with (
-        patch("prime_jennie.services.scout.rag_retriever.get_config") as mock_config,
-        patch("builtins.__import__", side_effect=mock_import),
-    ):
+    with patch("prime_jennie.services.scout.rag_retriever.get_config") as mock_config:
         mock_config.return_value.scout.enable_news_analysis = True
-        from prime_jennie.services.scout.rag_retriever import init_vectorstore
-
         result = init_vectorstore()
         assert result is None
 
@@ -73,20 +85,18 @@ def test_init_vectorstore_import_error():
 
 def test_discover_rag_candidates_returns_new_stocks():
     """RAG 후보 발굴: 기존 universe에 없는 종목 반환."""
-    mock_vs = MagicMock()
-
     # 4개 토픽 쿼리에 대해 각각 다른 결과 반환
-    mock_vs.similarity_search.side_effect = [
-        [_make_doc("[000660] SK하이닉스 실적 개선", stock_code="000660")],
-        [_make_doc("[035420] NAVER 수주", stock_code="035420")],
-        [_make_doc("[005930] 삼성전자 M&A", stock_code="005930")],  # 기존 universe에 있음
-        [],
-    ]
+    mock_vs = _FakeVectorStore(
+        [
+            [_make_doc("[000660] SK하이닉스 실적 개선", stock_code="000660")],
+            [_make_doc("[035420] NAVER 수주", stock_code="035420")],
+            [_make_doc("[005930] 삼성전자 M&A", stock_code="005930")],  # 기존 universe에 있음
+            [],
+        ]
+    )
 
     existing = {"005930": _make_master()}
 
-    from prime_jennie.services.scout.rag_retriever import discover_rag_candidates
-
     result = discover_rag_candidates(mock_vs, existing)
 
     assert "000660" in result
@@ -97,8 +107,6 @@ def test_discover_rag_candidates_returns_new_stocks():
 
 def test_discover_rag_candidates_none_vectorstore():
     """vectorstore=None → 빈 dict."""
-    from prime_jennie.services.scout.rag_retriever import discover_rag_candidates
-
     result = discover_rag_candidates(None, {})
     assert result == {}
 
@@ -108,25 +116,23 @@ def test_discover_rag_candidates_none_vectorstore():
 
 def test_fetch_news_for_stocks_returns_formatted_text():
     """종목별 뉴스 프리페치: 포맷된 텍스트 반환."""
-    mock_vs = MagicMock()
-
     docs = [
         _make_doc("[005930] 삼성전자 반도체 실적 호전", stock_code="005930"),
         _make_doc("[005930] 삼성전자 HBM 수주 확대", stock_code="005930"),
     ]
 
     # 3 base queries + 1 sector query = 4 calls
-    mock_vs.similarity_search.side_effect = [
-        docs[:1],
-        docs[1:],
-        [],
-        [],  # sector query
-    ]
+    mock_vs = _FakeVectorStore(
+        [
+            docs[:1],
+            docs[1:],
+            [],
+            [],  # sector query
+        ]
+    )
 
     enriched = {"005930": _make_enriched()}
 
-    from prime_jennie.services.scout.rag_retriever import fetch_news_for_stocks
-
     result = fetch_news_for_stocks(mock_vs, enriched, max_workers=1)
 
     assert "005930" in result
@@ -136,13 +142,10 @@ def test_fetch_news_for_stocks_returns_formatted_text():
 
 def test_fetch_news_for_stocks_no_news():
     """뉴스 없는 종목 → '최근 관련 뉴스 없음'."""
-    mock_vs = MagicMock()
-    mock_vs.similarity_search.return_value = []
+    mock_vs = _FakeVectorStore()
 
     enriched = {"005930": _make_enriched()}
 
-    from prime_jennie.services.scout.rag_retriever import fetch_news_for_stocks
-
     result = fetch_news_for_stocks(mock_vs, enriched, max_workers=1)
 
     assert result["005930"] == "최근 관련 뉴스 없음"
@@ -150,83 +153,50 @@ def test_fetch_news_for_stocks_no_news():
 
 def test_fetch_news_for_stocks_none_vectorstore():
     """vectorstore=None → 빈 dict."""
-    from prime_jennie.services.scout.rag_retriever import fetch_news_for_stocks
-
     result = fetch_news_for_stocks(None, {})
     assert result == {}
 
 
 # ─── analyst 프롬프트 뉴스 주입 ───────────────────────────────────
 
+_QUANT = QuantScore(
+    stock_code="005930",
+    stock_name="삼성전자",
+    total_score=71.0,
+    momentum_score=15.0,
+    quality_score=14.0,
+    value_score=12.0,
+    technical_score=7.0,
+    news_score=8.0,
+    supply_demand_score=15.0,
+)
+_CONTEXT = TradingContext.default()
+_NEWS_HEADER = "### 최근 뉴스 (RAG)"
+
 
 def test_news_context_in_prompt():
     """rag_news_context → _build_prompt에 포함."""
-    from prime_jennie.services.scout.analyst import _build_prompt
-
     candidate = _make_enriched()
     candidate.rag_news_context = "[삼성전자 HBM 수주 확대] | [반도체 업황 개선]"
 
-    quant = QuantScore(
-        stock_code="005930",
-        stock_name="삼성전자",
-        total_score=71.0,
-        momentum_score=15.0,
-        quality_score=14.0,
-        value_score=12.0,
-        technical_score=7.0,
-        news_score=8.0,
-        supply_demand_score=15.0,
-    )
-    context = TradingContext.default()
-
-    prompt = _build_prompt(quant, candidate, context)
-    assert "### 최근 뉴스 (RAG)" in prompt
+    prompt = _build_prompt(_QUANT, candidate, _CONTEXT)
+    assert _NEWS_HEADER in prompt
     assert "삼성전자 HBM 수주 확대" in prompt
 
 
 def test_news_context_skipped_when_empty():
     """rag_news_context=None → 뉴스 섹션 미포함."""
-    from prime_jennie.services.scout.analyst import _build_prompt
-
     candidate = _make_enriched()
     # rag_news_context is None by default
 
-    quant = QuantScore(
-        stock_code="005930",
-        stock_name="삼성전자",
-        total_score=71.0,
-        momentum_score=15.0,
-        quality_score=14.0,
-        value_score=12.0,
-        technical_score=7.0,
-        news_score=8.0,
-        supply_demand_score=15.0,
-    )
-    context = TradingContext.default()
-
-    prompt = _build_prompt(quant, candidate, context)
-    assert "### 최근 뉴스 (RAG)" not in prompt
+    prompt = _build_prompt(_QUANT, candidate, _CONTEXT)
+    assert _NEWS_HEADER not in prompt
 
 
 def test_news_context_skipped_for_placeholder():
     """'뉴스 DB 미연결' 등 플레이스홀더 → 뉴스 섹션 미포함."""
-    from prime_jennie.services.scout.analyst import _build_prompt
-
     candidate = _make_enriched()
     candidate.rag_news_context = "뉴스 DB 미연결"
 
-    quant = QuantScore(
-        stock_code="005930",
-        stock_name="삼성전자",
-        total_score=71.0,
-        momentum_score=15.0,
-        quality_score=14.0,
-        value_score=12.0,
-        technical_score=7.0,
-        news_score=8.0,
-        supply_demand_score=15.0,
-    )
-    context = TradingContext.default()
-
-    prompt = _build_prompt(quant, candidate, context)
-    assert "### 최근 뉴스 (RAG)" not in prompt
+    prompt = _build_prompt(_QUANT, candidate, _CONTEXT)
+    assert _NEWS_HEADER not in prompt
@@ -1,6 +1,7 @@
 """Scout Watchlist Selection 단위 테스트."""
 
 from datetime import UTC, date, datetime
+from functools import cache
 
 from prime_jennie.domain.enums import (
     MarketRegime,
@@ -30,7 +31,8 @@ def _make_hybrid(
     tradable: bool = True,
     veto: bool = False,
 ) -> HybridScore:
-    return HybridScore(
+    # 테스트 입력은 비즈니스 규칙을 만족하도록 구성 — 검증 생략
+    return HybridScore.model_construct(
         stock_code=code,
         stock_name=name,
         quant_score=hybrid - 5,
@@ -44,17 +46,20 @@ def _make_hybrid(
     )
 
 
-def _make_candidate(code: str, sector: SectorGroup = SectorGroup.SEMICONDUCTOR_IT) -> EnrichedCandidate:
-    return EnrichedCandidate(
-        master=StockMaster(
-            stock_code=code,
-            stock_name=f"Stock-{code}",
-            market="KOSPI",
-            sector_group=sector,
-        ),
+@cache
+def _make_master(code: str, sector: SectorGroup) -> StockMaster:
+    return StockMaster(
+        stock_code=code,
+        stock_name=f"Stock-{code}",
+        market="KOSPI",
+        sector_group=sector,
     )
 
 
+def _make_candidate(code: str, sector: SectorGroup = SectorGroup.SEMICONDUCTOR_IT) -> EnrichedCandidate:
+    return EnrichedCandidate(master=_make_master(code, sector))
+
+
 def _make_context(regime: MarketRegime = MarketRegime.BULL) -> TradingContext:
     return TradingContext(
         date=date(2026, 2, 19),
@@ -62,27 +67,26 @@ def _make_context(regime: MarketRegime = MarketRegime.BULL) -> TradingContext:
     )
 
 
-def _make_budget(**overrides: dict) -> SectorBudget:
-    """기본 WARM(cap=3) 예산."""
-    SectorBudgetEntry(
-        sector_group=SectorGroup.ETC,
+# 기본 WARM(cap=3) 항목 — select_watchlist는 읽기만 하므로 테스트 간 공유
+_DEFAULT_ENTRIES = {
+    group: SectorBudgetEntry(
+        sector_group=group,
         tier=SectorTier.WARM,
         watchlist_cap=3,
         portfolio_cap=3,
         effective_cap=3,
     )
-    entries = {}
-    for group in SectorGroup:
-        entries[group] = SectorBudgetEntry(
-            sector_group=group,
-            tier=SectorTier.WARM,
-            watchlist_cap=3,
-            portfolio_cap=3,
-            effective_cap=3,
-        )
+    for group in SectorGroup
+}
+_SG_BY_VALUE = {group.value: group for group in SectorGroup}
+
+
+def _make_budget(**overrides: int) -> SectorBudget:
+    """기본 WARM(cap=3) 예산."""
+    entries = dict(_DEFAULT_ENTRIES)
     # Apply overrides
     for group_str, cap in overrides.items():
-        group = SectorGroup(group_str)
+        group = _SG_BY_VALUE[group_str]
         entries[group] = SectorBudgetEntry(
             sector_group=group,
             tier=SectorTier.HOT if cap >= 5 else SectorTier.COOL if cap <= 2 else SectorTier.WARM,
@@ -193,9 +197,12 @@ class TestSelectWatchlist:
 
     def test_max_watchlist_size_not_exceeded(self):
         """MAX_WATCHLIST_SIZE 미초과."""
-        codes = [f"{i:06d}" for i in range(1, 26)]  # 000001 ~ 000025
-        scores = [_make_hybrid(c, f"S{c}", max(1.0, 90.0 - i)) for i, c in enumerate(codes)]
-        candidates = {c: _make_candidate(c) for c in codes}
+        scores = []
+        candidates = {}
+        for i in range(25):  # 000001 ~ 000025
+            code = f"{i + 1:06d}"
+            scores.append(_make_hybrid(code, f"S{code}", 90.0 - i))
+            candidates[code] = _make_candidate(code)
 
         result = select_watchlist(scores, candidates, None, _make_context(), max_size=20)
 
@@ -1,14 +1,16 @@
 """Sell Executor 단위 테스트."""
 
 from datetime import UTC, datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, patch
 
 import pytest
+import redis
 
 from prime_jennie.domain.enums import SellReason
 from prime_jennie.domain.portfolio import Position
 from prime_jennie.domain.stock import StockSnapshot
 from prime_jennie.domain.trading import OrderResult, SellOrder
+from prime_jennie.infra.kis.client import KISClient
 from prime_jennie.services.seller.executor import SellExecutor, SellResult
 
 
@@ -21,6 +23,9 @@ def _clear_config_cache():
     get_config.cache_clear()
 
 
+_NOW = datetime(2026, 2, 19, 10, 0, 0, tzinfo=UTC)
+
+
 @pytest.fixture(autouse=True)
 def _mock_market_hours():
     with patch("prime_jennie.services.seller.executor._is_market_hours", return_value=True):
@@ -34,7 +39,7 @@ def _make_sell_order(**overrides) -> SellOrder:
         "sell_reason": SellReason.TRAILING_STOP,
         "current_price": 77000,
         "quantity": 50,
-        "timestamp": datetime.now(UTC),
+        "timestamp": _NOW,
         "buy_price": 70000,
         "profit_pct": 10.0,
     }
@@ -42,33 +47,37 @@ def _make_sell_order(**overrides) -> SellOrder:
     return SellOrder(**defaults)
 
 
-def _mock_executor():
-    """테스트용 SellExecutor 생성."""
-    kis = MagicMock()
-    kis.get_price.return_value = StockSnapshot(
-        stock_code="005930",
-        price=77000,
-        timestamp=datetime.now(UTC),
-    )
-    kis.get_positions.return_value = [
-        Position(
-            stock_code="005930",
-            stock_name="삼성전자",
-            quantity=100,
-            average_buy_price=70000,
-            total_buy_amount=7_000_000,
-        )
-    ]
-    kis.sell.return_value = OrderResult(
-        success=True,
-        order_no="S001234",
-        stock_code="005930",
-        quantity=50,
-        price=77000,
-    )
+_SNAPSHOT = StockSnapshot(
+    stock_code="005930",
+    price=77000,
+    timestamp=_NOW,
+)
+_POSITION = Position(
+    stock_code="005930",
+    stock_name="삼성전자",
+    quantity=100,
+    average_buy_price=70000,
+    total_buy_amount=7_000_000,
+)
+_ORDER_OK = OrderResult(
+    success=True,
+    order_no="S001234",
+    stock_code="005930",
+    quantity=50,
+    price=77000,
+)
+
+
+@pytest.fixture
+def executor() -> SellExecutor:
+    """테스트용 SellExecutor (호출 검증용 mock은 테스트마다 새로 생성)."""
+    kis = Mock(spec=KISClient)
+    kis.get_price.return_value = _SNAPSHOT
+    kis.get_positions.return_value = [_POSITION]
+    kis.sell.return_value = _ORDER_OK
     kis.confirm_order.return_value = {"filled_qty": 50, "avg_price": 77000.0}
 
-    redis_client = MagicMock()
+    redis_client = Mock(spec=redis.Redis)
     redis_client.get.return_value = None  # no emergency stop
     redis_client.set.return_value = True  # lock acquired
 
@@ -76,9 +85,8 @@ def _mock_executor():
 
 
 class TestSellExecutor:
-    def test_successful_sell(self):
+    def test_successful_sell(self, executor):
         """정상 매도 실행."""
-        executor = _mock_executor()
         order = _make_sell_order()
         result = executor.process_signal(order)
 
@@ -87,9 +95,8 @@ class TestSellExecutor:
         assert result.quantity == 50
         assert result.profit_pct == 10.0
 
-    def test_not_holding_skipped(self):
+    def test_not_holding_skipped(self, executor):
         """미보유 종목 → 스킵."""
-        executor = _mock_executor()
         executor._kis.get_positions.return_value = []
         order = _make_sell_order()
         result = executor.process_signal(order)
@@ -97,56 +104,47 @@ class TestSellExecutor:
         assert result.status == "skipped"
         assert "Not holding" in result.reason
 
-    def test_emergency_stop_blocks(self):
-        """Emergency stop → 스킵."""
-        executor = _mock_executor()
-        executor._redis.get.return_value = "1"
-        order = _make_sell_order()
-        result = executor.process_signal(order)
+    @pytest.mark.parametrize(
+        ("redis_method", "return_value", "reason"),
+        [
+            pytest.param("get", "1", "Emergency", id="emergency_stop"),
+            pytest.param("set", False, "Lock", id="lock_failure"),
+        ],
+    )
+    def test_redis_guard_skips(self, executor, redis_method, return_value, reason):
+        """Emergency stop 활성 / 분산 락 실패 → 스킵."""
+        getattr(executor._redis, redis_method).return_value = return_value
+        result = executor.process_signal(_make_sell_order())
 
         assert result.status == "skipped"
-        assert "Emergency" in result.reason
+        assert reason in result.reason
 
-    def test_manual_bypasses_emergency(self):
+    def test_manual_bypasses_emergency(self, executor):
         """MANUAL 매도는 emergency stop 통과."""
-        executor = _mock_executor()
         executor._redis.get.return_value = "1"  # emergency active
         order = _make_sell_order(sell_reason=SellReason.MANUAL)
         result = executor.process_signal(order)
 
         assert result.status == "success"
 
-    def test_forced_liquidation_bypasses_emergency(self):
+    def test_forced_liquidation_bypasses_emergency(self, executor):
         """FORCED_LIQUIDATION 매도는 emergency stop 통과."""
-        executor = _mock_executor()
         executor._redis.get.return_value = "1"  # emergency active
         order = _make_sell_order(sell_reason=SellReason.FORCED_LIQUIDATION)
         result = executor.process_signal(order)
 
         assert result.status == "success"
 
-    def test_forced_liquidation_bypasses_market_hours(self):
+    def test_forced_liquidation_bypasses_market_hours(self, executor):
         """FORCED_LIQUIDATION은 장시간 체크 bypass."""
-        executor = _mock_executor()
         order = _make_sell_order(sell_reason=SellReason.FORCED_LIQUIDATION)
         with patch("prime_jennie.services.seller.executor._is_market_hours", return_value=False):
             result = executor.process_signal(order)
 
         assert result.status == "success"
 
-    def test_lock_failure_skipped(self):
-        """분산 락 실패."""
-        executor = _mock_executor()
-        executor._redis.set.return_value = False
-        order = _make_sell_order()
-        result = executor.process_signal(order)
-
-        assert result.status == "skipped"
-        assert "Lock" in result.reason
-
-    def test_quantity_capped_to_holding(self):
+    def test_quantity_capped_to_holding(self, executor):
         """매도 수량이 보유 수량 초과 시 보유량으로 제한."""
-        executor = _mock_executor()
         executor._kis.confirm_order.return_value = {"filled_qty": 100, "avg_price": 77000.0}
         order = _make_sell_order(quantity=200)  # 보유 100주
         result = executor.process_signal(order)
@@ -154,9 +152,8 @@ class TestSellExecutor:
         assert result.status == "success"
         assert result.quantity == 100  # capped to holding
 
-    def test_order_failure_error(self):
+    def test_order_failure_error(self, executor):
         """주문 실패."""
-        executor = _mock_executor()
         executor._kis.sell.return_value = OrderResult(
             success=False,
             stock_code="005930",
@@ -169,9 +166,8 @@ class TestSellExecutor:
 
         assert result.status == "error"
 
-    def test_stop_loss_sets_cooldown(self):
+    def test_stop_loss_sets_cooldown(self, executor):
         """손절 시 쿨다운 설정."""
-        executor = _mock_executor()
         order = _make_sell_order(sell_reason=SellReason.STOP_LOSS)
         result = executor.process_signal(order)
 
@@ -179,9 +175,8 @@ class TestSellExecutor:
         # Verify cooldown was set
         executor._redis.setex.assert_called()
 
-    def test_full_sell_cleanup(self):
+    def test_full_sell_cleanup(self, executor):
         """전량 매도 시 Redis 정리."""
-        executor = _mock_executor()
         executor._kis.confirm_order.return_value = {"filled_qty": 100, "avg_price": 77000.0}
         order = _make_sell_order(quantity=100)  # 보유량과 동일
         result = executor.process_signal(order)
@@ -190,9 +185,8 @@ class TestSellExecutor:
         # Verify cleanup pipeline was called
         executor._redis.pipeline.assert_called()
 
-    def test_not_filled_then_cancel_then_recheck_success(self):
+    def test_not_filled_then_cancel_then_recheck_success(self, executor):
         """미체결 → 취소 → 재확인에서 체결 확인 → 성공."""
-        executor = _mock_executor()
         executor._kis.confirm_order.return_value = None  # 폴링 미체결
         executor._kis.cancel_order.return_value = False  # 취소 실패 (이미 체결)
         executor._kis.check_order_status.return_value = {
@@ -207,9 +201,8 @@ class TestSellExecutor:
         assert result.quantity == 50
         assert result.price == 76500
 
-    def test_not_filled_then_cancel_then_recheck_failure(self):
+    def test_not_filled_then_cancel_then_recheck_failure(self, executor):
         """미체결 → 취소 → 재확인에서도 미체결 → 에러."""
-        executor = _mock_executor()
         executor._kis.confirm_order.return_value = None
         executor._kis.cancel_order.return_value = True
         executor._kis.check_order_status.return_value = {
@@ -223,9 +216,8 @@ class TestSellExecutor:
         assert result.status == "error"
         assert "not filled" in result.reason.lower()
 
-    def test_forced_liquidation_uses_extended_polling(self):
+    def test_forced_liquidation_uses_extended_polling(self, executor):
         """FORCED_LIQUIDATION은 확장 폴링 파라미터 사용."""
-        executor = _mock_executor()
         order = _make_sell_order(sell_reason=SellReason.FORCED_LIQUIDATION)
         executor.process_signal(order)
 
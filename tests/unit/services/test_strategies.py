@@ -1,13 +1,18 @@
 """Strategy Detection 단위 테스트."""
 
-from datetime import UTC
+from datetime import UTC, datetime, timedelta
+from functools import cache
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
 
 from prime_jennie.domain.config import ScannerConfig
 from prime_jennie.domain.enums import MarketRegime, SignalType, TradeTier
 from prime_jennie.domain.watchlist import WatchlistEntry
+from prime_jennie.services.indicators import calculate_rsi
 from prime_jennie.services.scanner.bar_engine import Bar
 from prime_jennie.services.scanner.strategies import (
-    _compute_rsi,
     _compute_sma,
     compute_rsi_from_bars,
     detect_dip_buy,
@@ -19,27 +24,24 @@ from prime_jennie.services.scanner.strategies import (
     detect_volume_breakout,
 )
 
+_NOW = datetime(2026, 2, 19, 10, 0, 0, tzinfo=UTC)
+
 
+@cache  # Bar는 frozen → 동일 인자 바는 인스턴스 공유
 def _make_bar(close: float = 100, open: float = 99, high: float = 101, low: float = 98, volume: int = 1000) -> Bar:
     return Bar(timestamp=1000.0, open=open, high=high, low=low, close=close, volume=volume)
 
 
 def _make_bars_trend(n: int, start: float = 100, step: float = 1.0) -> list[Bar]:
     """상승/하락 추세 바 생성."""
-    bars = []
-    for i in range(n):
-        price = start + step * i
-        bars.append(
-            Bar(
-                timestamp=float(i * 60),
-                open=price - 0.5,
-                high=price + 1.0,
-                low=price - 1.0,
-                close=price,
-                volume=10000 + i * 100,
-            )
-        )
-    return bars
+    idx = np.arange(n)
+    prices = (start + step * idx).tolist()
+    timestamps = (idx * 60.0).tolist()
+    volumes = (10000 + idx * 100).tolist()
+    return [
+        Bar(timestamp=ts, open=p - 0.5, high=p + 1.0, low=p - 1.0, close=p, volume=v)
+        for ts, p, v in zip(timestamps, prices, volumes, strict=True)
+    ]
 
 
 def _make_entry(
@@ -48,8 +50,6 @@ def _make_entry(
     llm: float = 72.0,
     tier: TradeTier = TradeTier.TIER1,
 ) -> WatchlistEntry:
-    from datetime import datetime
-
     return WatchlistEntry(
         stock_code=code,
         stock_name="삼성전자",
@@ -58,7 +58,7 @@ def _make_entry(
         rank=1,
         is_tradable=True,
         trade_tier=tier,
-        scored_at=datetime.now(UTC),
+        scored_at=_NOW,
     )
 
 
@@ -71,131 +71,25 @@ class TestSMA:
         assert _compute_sma([10, 20], 5) is None
 
 
-class TestRSI:
-    def test_uptrend_above_50(self):
-        closes = [100 + i for i in range(30)]
-        rsi = _compute_rsi(closes)
-        assert rsi is not None
-        assert rsi > 50
-
-    def test_downtrend_below_50(self):
-        closes = [200 - i for i in range(30)]
-        rsi = _compute_rsi(closes)
-        assert rsi is not None
-        assert rsi < 50
-
-    def test_insufficient_data(self):
-        assert _compute_rsi([100, 101]) is None
+# prev: MA5=97.0 < MA20=99.25, curr: MA5=100.6 > MA20=100.15
+_GOLDEN_CROSS_CLOSES = (100,) * 15 + (97,) * 5 + (115,)
 
 
 class TestGoldenCross:
-    def test_valid_golden_cross(self):
-        """MA5가 MA20을 상향 돌파."""
-        # 구성: 처음 16개 바는 100 (MA20에 기여), 이후 5개는 98 (MA5 < MA20),
-        # 마지막에 상승하여 MA5 > MA20 (교차)
-        bars = []
-        # 첫 16개: close=100
-        for _i in range(16):
-            bars.append(_make_bar(close=100))
-        # 다음 4개: close=98 (MA5를 MA20 아래로 끌어내림)
-        for _i in range(4):
-            bars.append(_make_bar(close=98))
-        # 마지막 1개: close=103 (MA5가 MA20 위로 교차)
-        # MA20(이전) = (100*16 + 98*4) / 20 = 99.6
-        # MA5(이전) = (100 + 98*4) / 5 = 98.4 → MA5 < MA20
-        # 마지막 바 추가 후:
-        # MA20(현재) = (100*15 + 98*4 + 103) / 20 = 99.75
-        # MA5(현재) = (98*3 + 98 + 103) / 5 = 99.0... 아직 부족
-        # 더 극단적으로
-        bars = []
-        for _i in range(16):
-            bars.append(_make_bar(close=100))
-        for _i in range(4):
-            bars.append(_make_bar(close=96))  # 더 낮게
-        # 현재: MA5(prev) = avg of bars[15:20] = (100+96*4)/5 = 96.8, MA20(prev) = (100*16+96*4)/20 = 99.2
-        # 마지막 바 105 추가
-        bars.append(_make_bar(close=108))
-        # MA5(curr) = avg of bars[16:21] = (96*4+108)/5 = 98.4, MA20(curr) still ~99.6... 아직 부족
-        # 2개 더 추가
-        bars.append(_make_bar(close=110))
-        # MA5 = (96*3+108+110)/5 = 100.8, MA20 = ... complex. 다른 접근 필요
-
-        # 간단한 접근: 충분한 교차 데이터
-        bars = []
-        for _i in range(15):
-            bars.append(_make_bar(close=90))
-        for _i in range(5):
-            bars.append(_make_bar(close=100))
-        # prev_bars: bars[:-1] → 15개 90 + 4개 100
-        # prev_MA5 = (90 + 100*4)/5 = 98, prev_MA20 = (90*15 + 100*4)/19... 바가 20개이므로
-        # prev = bars[:20] → MA5(bars[14:19]) = (90+100*4)/5=98, MA20(bars[0:19])=(90*15+100*4)/19 → 19개라 미달
-        # 21개여야 MA5와 MA20 모두 계산 가능
-        bars.append(_make_bar(close=110))
-        # 이제 21개: MA5(curr) = (100*4+110)/5 = 102, MA20(curr) = (90*15+100*5+110)/21... 아 장기는 20개
-
-        # 가장 간단: 정확히 제어된 close 값 사용
-        bars = [
-            _make_bar(close=c)
-            for c in [
-                90,
-                90,
-                90,
-                90,
-                90,
-                90,
-                90,
-                90,
-                90,
-                90,  # 0-9: 90
-                90,
-                90,
-                90,
-                90,
-                90,  # 10-14: 90
-                92,
-                94,
-                96,
-                98,
-                100,  # 15-19: 상승
-                105,  # 20: 급등 → MA5 교차
-            ]
-        ]
-        # prev (bars[:20]): MA5 = avg(92,94,96,98,100) = 96, MA20 = avg(90*15, 92,94,96,98,100) = 92
-        # → MA5(96) > MA20(92)? 이미 위에 있음. prev_prev도 확인:
-        # prev of prev (bars[:19]): MA5 = avg(90,92,94,96,98) = 94, MA20 = (90*15+92+94+96+98)/19... 19개 미달
-        # 20개 필요하므로 bars[:20] → prev MA5 = avg(96,98,100,105...) 아니 인덱스 잘못
-        # detect_golden_cross에서 closes = [b.close for b in bars] → len=21
-        # MA5(curr) = avg(closes[-5:]) = avg(96,98,100,105,...) → 여기 21개이면 마지막 5개 = (94,96,98,100,105) = 98.6
-        # 아... 더 단순하게 하자
-
-        # 확실한 교차 데이터
-        # prev: MA5=97.0 < MA20=99.25, curr: MA5=100.6 > MA20=100.15
-        closes = [100] * 20
-        closes[-5:] = [97, 97, 97, 97, 97]
-        closes.append(115)  # X>112 필요 (3X > 336)
+    @pytest.mark.parametrize(
+        ("closes", "volume_ratio", "detected"),
+        [
+            pytest.param(_GOLDEN_CROSS_CLOSES, 1.5, True, id="cross"),
+            pytest.param((100,) * 20 + (110,), 1.5, True, id="cross_from_equal_mas"),
+            pytest.param([100 + 0.5 * i for i in range(25)], 1.5, False, id="already_aligned"),
+            pytest.param(_GOLDEN_CROSS_CLOSES, 0.5, False, id="insufficient_volume"),
+        ],
+    )
+    def test_golden_cross(self, closes, volume_ratio, detected):
         bars = [_make_bar(close=c) for c in closes]
-
-        result = detect_golden_cross(bars, volume_ratio=1.5)
-        assert result.detected
-        assert result.signal_type == SignalType.GOLDEN_CROSS
-
-    def test_no_cross(self):
-        """교차 없음."""
-        bars = _make_bars_trend(25, start=100, step=0.5)  # 단조 상승
-        result = detect_golden_cross(bars, volume_ratio=1.5)
-        # 이미 정배열이므로 교차 없음
-        assert not result.detected
-
-    def test_insufficient_volume(self):
-        """거래량 부족."""
-        bars = _make_bars_trend(25, start=100, step=0.0)
-        for i in range(15):
-            bars[i] = _make_bar(close=99)
-        for i in range(15, 25):
-            bars[i] = _make_bar(close=101)
-
-        result = detect_golden_cross(bars, volume_ratio=0.5, min_volume_ratio=1.5)
-        assert not result.detected
+        result = detect_golden_cross(bars, volume_ratio=volume_ratio, min_volume_ratio=1.5)
+        assert result.detected is detected
+        assert result.signal_type == (SignalType.GOLDEN_CROSS if detected else None)
 
 
 class TestMomentum:
@@ -264,12 +158,8 @@ class TestRSIRebound:
 class TestDipBuy:
     def test_valid_dip(self):
         """Watchlist D+1, 조정 매수."""
-        from datetime import datetime, timedelta
-
-        bars = [_make_bar(close=100, high=102)] * 3
-        bars.extend([_make_bar(close=99, high=100), _make_bar(close=98, high=99)])
-        entry = _make_entry()
-        entry.scored_at = datetime.now(UTC) - timedelta(days=1)
+        bars = [_make_bar(close=c, high=h) for c, h in ((100, 102), (100, 102), (100, 102), (99, 100), (98, 99))]
+        entry = _make_entry().model_copy(update={"scored_at": datetime.now(UTC) - timedelta(days=1)})
 
         result = detect_dip_buy("005930", bars, entry, MarketRegime.BULL)
         # 조건 체크: 5개 바 고점 102, 현재 98 → dip = -3.9%
@@ -280,19 +170,15 @@ class TestDipBuy:
     def test_no_scored_at(self):
         """scored_at 없으면 비활성."""
         bars = _make_bars_trend(5, start=100, step=-1.0)
-        entry = _make_entry()
-        entry.scored_at = None
+        entry = _make_entry().model_copy(update={"scored_at": None})
 
         result = detect_dip_buy("005930", bars, entry, MarketRegime.BULL)
         assert not result.detected
 
     def test_too_old(self):
         """D+6 이상이면 비활성."""
-        from datetime import datetime, timedelta
-
         bars = _make_bars_trend(5, start=100, step=-0.5)
-        entry = _make_entry()
-        entry.scored_at = datetime.now(UTC) - timedelta(days=10)
+        entry = _make_entry().model_copy(update={"scored_at": datetime.now(UTC) - timedelta(days=10)})
 
         result = detect_dip_buy("005930", bars, entry, MarketRegime.BULL)
         assert not result.detected
@@ -328,6 +214,10 @@ class TestComputeRSIFromBars:
         rsi = compute_rsi_from_bars(bars)
         assert rsi is None
 
+    def test_matches_close_list(self):
+        bars = [_make_bar(close=c) for c in (100, 103, 101, 99, 104, 102, 106, 105, 103, 107, 109, 108, 106, 110, 111)]
+        assert compute_rsi_from_bars(bars) == pytest.approx(calculate_rsi([b.close for b in bars]))
+
 
 def _orb_config(**overrides) -> ScannerConfig:
     """ORB 활성화된 ScannerConfig 생성."""
@@ -345,9 +235,6 @@ def _orb_config(**overrides) -> ScannerConfig:
 
 def _orb_now(hour: int = 9, minute: int = 30):
     """ORB 테스트용 KST datetime."""
-    from datetime import datetime
-    from zoneinfo import ZoneInfo
-
     return datetime(2026, 2, 25, hour, minute, tzinfo=ZoneInfo("Asia/Seoul"))
 
 
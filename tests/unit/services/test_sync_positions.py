@@ -2,7 +2,7 @@
 
 from unittest.mock import MagicMock
 
-from sqlmodel import Session
+import pytest
 
 from prime_jennie.infra.database.models import PositionDB, StockMasterDB, TradeLogDB
 from prime_jennie.services.jobs.app import apply_sync, compare_positions
@@ -10,60 +10,92 @@ from prime_jennie.services.jobs.app import apply_sync, compare_positions
 # ─── Fixtures ─────────────────────────────────────────────────
 
 
-def _kis_pos(
-    stock_code: str = "005930",
-    stock_name: str = "삼성전자",
-    quantity: int = 100,
-    average_buy_price: int = 72000,
-    total_buy_amount: int = 7_200_000,
-    current_price: int = 73000,
-) -> dict:
-    return {
-        "stock_code": stock_code,
-        "stock_name": stock_name,
-        "quantity": quantity,
-        "average_buy_price": average_buy_price,
-        "total_buy_amount": total_buy_amount,
-        "current_price": current_price,
-    }
-
-
-def _db_pos(
-    stock_code: str = "005930",
-    stock_name: str = "삼성전자",
-    quantity: int = 100,
-    average_buy_price: int = 72000,
-    total_buy_amount: int = 7_200_000,
-    sector_group: str | None = "IT",
-    high_watermark: int | None = 75000,
-    stop_loss_price: int | None = 68400,
-) -> PositionDB:
-    return PositionDB(
-        stock_code=stock_code,
-        stock_name=stock_name,
-        quantity=quantity,
-        average_buy_price=average_buy_price,
-        total_buy_amount=total_buy_amount,
-        sector_group=sector_group,
-        high_watermark=high_watermark,
-        stop_loss_price=stop_loss_price,
-    )
+_DEFAULT_KIS = {
+    "stock_code": "005930",
+    "stock_name": "삼성전자",
+    "quantity": 100,
+    "average_buy_price": 72000,
+    "total_buy_amount": 7_200_000,
+    "current_price": 73000,
+}
+_DEFAULT_DB_KWARGS = {
+    "stock_code": "005930",
+    "stock_name": "삼성전자",
+    "quantity": 100,
+    "average_buy_price": 72000,
+    "total_buy_amount": 7_200_000,
+    "sector_group": "IT",
+    "high_watermark": 75000,
+    "stop_loss_price": 68400,
+}
+
+
+def _kis_pos(**overrides) -> dict:
+    return {**_DEFAULT_KIS, **overrides}
+
+
+def _db_pos(**overrides) -> PositionDB:
+    return PositionDB(**{**_DEFAULT_DB_KWARGS, **overrides})
+
+
+# apply_sync는 diff를 읽기만 함
+_EMPTY_DIFF = {
+    "only_in_kis": [],
+    "only_in_db": [],
+    "quantity_mismatch": [],
+    "price_mismatch": [],
+    "matched": [],
+}
+
+
+class _FakeSession:
+    """apply_sync가 쓰는 get/add/delete/flush만 제공하는 Session 대역."""
+
+    def __init__(self, store: dict[str, PositionDB]):
+        self._store = store
+        self.add = MagicMock()
+        self.delete = MagicMock()
+
+    def get(self, model, pk):
+        return self._store.get(pk)
+
+    def flush(self) -> None:
+        pass
+
+
+def _added(session: _FakeSession, i: int):
+    """i번째 session.add() 호출 인자."""
+    return session.add.call_args_list[i].args[0]
 
 
 # ─── compare_positions tests ─────────────────────────────────
 
 
 class TestComparePositions:
-    def test_all_matched(self):
-        kis = [_kis_pos()]
-        db = [_db_pos()]
+    @pytest.mark.parametrize(
+        ("kis_qty", "db_qty", "kis_avg", "db_avg", "bucket", "fields"),
+        [
+            pytest.param(100, 100, 72000, 72000, "matched", {}, id="matched"),
+            # KIS 평단가 소수점은 절사 → 1원 미만 차이는 일치
+            pytest.param(100, 100, 72000.7, 72000, "matched", {}, id="price_within_tolerance"),
+            pytest.param(150, 100, 72000, 72000, "quantity_mismatch", {"kis_qty": 150, "db_qty": 100}, id="quantity"),
+            pytest.param(100, 100, 72500, 72000, "price_mismatch", {"kis_avg": 72500, "db_avg": 72000}, id="price"),
+            # 수량과 가격 모두 다르면 quantity_mismatch로 분류
+            pytest.param(150, 100, 73000, 72000, "quantity_mismatch", {"kis_qty": 150}, id="quantity_over_price"),
+        ],
+    )
+    def test_single_position_bucket(self, kis_qty, db_qty, kis_avg, db_avg, bucket, fields):
+        kis = [_kis_pos(quantity=kis_qty, average_buy_price=kis_avg)]
+        db = [_db_pos(quantity=db_qty, average_buy_price=db_avg)]
         diff = compare_positions(kis, db)
 
-        assert diff["matched"] == ["005930"]
-        assert diff["only_in_kis"] == []
-        assert diff["only_in_db"] == []
-        assert diff["quantity_mismatch"] == []
-        assert diff["price_mismatch"] == []
+        assert len(diff[bucket]) == 1
+        assert [key for key, items in diff.items() if items] == [bucket]
+        if bucket == "matched":
+            assert diff["matched"] == ["005930"]
+        else:
+            assert diff[bucket][0]["stock_code"] == "005930"
+            assert fields.items() <= diff[bucket][0].items()
 
     def test_empty_both(self):
         diff = compare_positions([], [])
@@ -88,46 +120,6 @@ class TestComparePositions:
         assert len(diff["only_in_db"]) == 1
         assert diff["only_in_db"][0].stock_code == "035420"
 
-    def test_quantity_mismatch(self):
-        kis = [_kis_pos(quantity=150)]
-        db = [_db_pos(quantity=100)]
-        diff = compare_positions(kis, db)
-
-        assert len(diff["quantity_mismatch"]) == 1
-        m = diff["quantity_mismatch"][0]
-        assert m["kis_qty"] == 150
-        assert m["db_qty"] == 100
-        assert diff["matched"] == []
-
-    def test_price_mismatch(self):
-        kis = [_kis_pos(average_buy_price=72500)]
-        db = [_db_pos(average_buy_price=72000)]
-        diff = compare_positions(kis, db)
-
-        assert len(diff["price_mismatch"]) == 1
-        m = diff["price_mismatch"][0]
-        assert m["kis_avg"] == 72500
-        assert m["db_avg"] == 72000
-        assert diff["matched"] == []
-
-    def test_price_within_tolerance(self):
-        """평단가 차이 < 1원이면 일치로 처리."""
-        kis = [_kis_pos(average_buy_price=72000)]
-        db = [_db_pos(average_buy_price=72000)]
-        diff = compare_positions(kis, db)
-
-        assert diff["matched"] == ["005930"]
-        assert diff["price_mismatch"] == []
-
-    def test_quantity_takes_priority_over_price(self):
-        """수량과 가격 모두 다르면 quantity_mismatch로 분류."""
-        kis = [_kis_pos(quantity=150, average_buy_price=73000)]
-        db = [_db_pos(quantity=100, average_buy_price=72000)]
-        diff = compare_positions(kis, db)
-
-        assert len(diff["quantity_mismatch"]) == 1
-        assert diff["price_mismatch"] == []
-
     def test_mixed_all_categories(self):
         """5가지 카테고리가 모두 등장하는 케이스."""
         kis = [
@@ -161,26 +153,13 @@ class TestComparePositions:
 
 
 class TestApplySync:
-    def _mock_session(self, existing: dict[str, PositionDB] | None = None) -> MagicMock:
-        session = MagicMock(spec=Session)
-        store = dict(existing or {})
-
-        def mock_get(model, pk):
-            return store.get(pk)
-
-        session.get.side_effect = mock_get
-        return session
+    def _mock_session(self, existing: dict[str, PositionDB] | None = None) -> _FakeSession:
+        return _FakeSession(dict(existing or {}))
 
     def test_insert_only_in_kis(self):
         session = self._mock_session()
         kis = [_kis_pos(stock_code="000660", stock_name="SK하이닉스", current_price=180000)]
-        diff = {
-            "only_in_kis": kis,
-            "only_in_db": [],
-            "quantity_mismatch": [],
-            "price_mismatch": [],
-            "matched": [],
-        }
+        diff = {**_EMPTY_DIFF, "only_in_kis": kis}
         actions = apply_sync(session, diff, kis)
 
         assert len(actions) == 1
@@ -188,9 +167,9 @@ class TestApplySync:
         assert "000660" in actions[0]
         # StockMasterDB 자동 생성 + PositionDB INSERT + TradeLogDB BUY = 3회 호출
         assert session.add.call_count == 3
-        added_master = session.add.call_args_list[0][0][0]
-        added_pos = session.add.call_args_list[1][0][0]
-        added_log = session.add.call_args_list[2][0][0]
+        added_master = _added(session, 0)
+        added_pos = _added(session, 1)
+        added_log = _added(session, 2)
         assert isinstance(added_master, StockMasterDB)
         assert added_master.stock_code == "000660"
         assert isinstance(added_pos, PositionDB)
@@ -205,34 +184,22 @@ class TestApplySync:
         """current_price가 0이면 average_buy_price를 high_watermark로 사용."""
         session = self._mock_session()
         kis = [_kis_pos(stock_code="000660", current_price=0, average_buy_price=170000)]
-        diff = {
-            "only_in_kis": kis,
-            "only_in_db": [],
-            "quantity_mismatch": [],
-            "price_mismatch": [],
-            "matched": [],
-        }
+        diff = {**_EMPTY_DIFF, "only_in_kis": kis}
         apply_sync(session, diff, kis)
-        added_pos = session.add.call_args_list[1][0][0]
+        added_pos = _added(session, 1)
         assert added_pos.high_watermark == 170000
 
     def test_delete_only_in_db(self):
         pos = _db_pos(stock_code="035420", stock_name="NAVER")
         session = self._mock_session(existing={"035420": pos})
-        diff = {
-            "only_in_kis": [],
-            "only_in_db": [pos],
-            "quantity_mismatch": [],
-            "price_mismatch": [],
-            "matched": [],
-        }
+        diff = {**_EMPTY_DIFF, "only_in_db": [pos]}
         actions = apply_sync(session, diff, [])
 
         assert len(actions) == 1
         assert "DELETE" in actions[0]
         session.delete.assert_called_once_with(pos)
         # TradeLogDB SELL 기록
-        added_log = session.add.call_args[0][0]
+        added_log = _added(session, -1)
         assert isinstance(added_log, TradeLogDB)
         assert added_log.trade_type == "SELL"
         assert added_log.reason == "MANUAL_SYNC"
@@ -243,11 +210,8 @@ class TestApplySync:
         session = self._mock_session(existing={"005930": pos})
         kis = [_kis_pos(stock_code="005930", quantity=150, average_buy_price=72000, total_buy_amount=10_800_000)]
         diff = {
-            "only_in_kis": [],
-            "only_in_db": [],
+            **_EMPTY_DIFF,
             "quantity_mismatch": [{"stock_code": "005930", "stock_name": "삼성전자", "kis_qty": 150, "db_qty": 100}],
-            "price_mismatch": [],
-            "matched": [],
         }
         actions = apply_sync(session, diff, kis)
 
@@ -262,11 +226,8 @@ class TestApplySync:
         session = self._mock_session(existing={"005930": pos})
         kis = [_kis_pos(stock_code="005930", quantity=100, average_buy_price=72500, total_buy_amount=7_250_000)]
         diff = {
-            "only_in_kis": [],
-            "only_in_db": [],
-            "quantity_mismatch": [],
+            **_EMPTY_DIFF,
             "price_mismatch": [{"stock_code": "005930", "stock_name": "삼성전자", "kis_avg": 72500, "db_avg": 72000}],
-            "matched": [],
         }
         actions = apply_sync(session, diff, kis)
 
@@ -283,11 +244,8 @@ class TestApplySync:
         session = self._mock_session(existing={"005930": pos})
         kis = [_kis_pos(stock_code="005930", quantity=150, average_buy_price=73000, total_buy_amount=10_950_000)]
         diff = {
-            "only_in_kis": [],
-            "only_in_db": [],
+            **_EMPTY_DIFF,
             "quantity_mismatch": [{"stock_code": "005930", "stock_name": "삼성전자", "kis_qty": 150, "db_qty": 100}],
-            "price_mismatch": [],
-            "matched": [],
         }
         actions = apply_sync(session, diff, kis)
 
@@ -307,11 +265,8 @@ class TestApplySync:
         session = self._mock_session(existing={"005930": pos})
         kis = [_kis_pos(stock_code="005930", quantity=150, current_price=73000)]
         diff = {
-            "only_in_kis": [],
-            "only_in_db": [],
+            **_EMPTY_DIFF,
             "quantity_mismatch": [{"stock_code": "005930", "stock_name": "삼성전자", "kis_qty": 150, "db_qty": 100}],
-            "price_mismatch": [],
-            "matched": [],
         }
         apply_sync(session, diff, kis)
 
@@ -323,13 +278,7 @@ class TestApplySync:
         pos = _db_pos(stock_code="005930", high_watermark=73000)
         session = self._mock_session(existing={"005930": pos})
         kis = [_kis_pos(stock_code="005930", current_price=76000)]
-        diff = {
-            "only_in_kis": [],
-            "only_in_db": [],
-            "quantity_mismatch": [],
-            "price_mismatch": [],
-            "matched": ["005930"],
-        }
+        diff = {**_EMPTY_DIFF, "matched": ["005930"]}
         actions = apply_sync(session, diff, kis)
 
         assert pos.high_watermark == 76000
@@ -341,13 +290,7 @@ class TestApplySync:
         pos = _db_pos(stock_code="005930", high_watermark=75000)
         session = self._mock_session(existing={"005930": pos})
         kis = [_kis_pos(stock_code="005930", current_price=73000)]  # 73000 < 75000
-        diff = {
-            "only_in_kis": [],
-            "only_in_db": [],
-            "quantity_mismatch": [],
-            "price_mismatch": [],
-            "matched": ["005930"],
-        }
+        diff = {**_EMPTY_DIFF, "matched": ["005930"]}
         actions = apply_sync(session, diff, kis)
 
         assert actions == []
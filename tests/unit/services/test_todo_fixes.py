@@ -7,10 +7,20 @@
 - BuyExecutor ATR/sector_group 연동
 """
 
-from datetime import UTC, date, datetime
+import json
+from datetime import UTC, date, datetime, timedelta
 from unittest.mock import MagicMock, patch
 
-from prime_jennie.services.buyer.position_sizing import calculate_atr, calculate_rsi, clamp_atr
+import numpy as np
+import pytest
+
+from prime_jennie.services.buyer.position_sizing import (
+    OHLC_DTYPE,
+    calculate_atr,
+    clamp_atr,
+    to_ohlc_array,
+)
+from prime_jennie.services.indicators import calculate_rsi
 
 # ─── RSI Calculation ───────────────────────────────────────────
 
@@ -51,6 +61,24 @@ class TestCalculateRSI:
         assert rsi is not None
         assert 30.0 < rsi < 70.0  # 등락 반복 → 중간 RSI
 
+    def test_short_period_known_value(self):
+        """period=2: seed (0.5, 0.5) → 평활 (1.25, 0.25) → RS=5."""
+        assert calculate_rsi([10, 11, 10, 12], period=2) == pytest.approx(100 - 100 / 6)
+
+    def test_matches_iterative_wilder(self):
+        """닫힌 형태 평활 == 점화식 Wilder 평활."""
+        prices = [100, 102, 101, 103, 100, 98, 101, 104, 103, 105, 102, 99, 101, 103, 104, 106, 103, 101, 104, 107]
+        deltas = [b - a for a, b in zip(prices, prices[1:], strict=False)]
+        avg_gain = sum(max(d, 0) for d in deltas[:14]) / 14
+        avg_loss = sum(max(-d, 0) for d in deltas[:14]) / 14
+        for d in deltas[14:]:
+            avg_gain = (avg_gain * 13 + max(d, 0)) / 14
+            avg_loss = (avg_loss * 13 + max(-d, 0)) / 14
+        expected = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+        assert calculate_rsi(prices) == pytest.approx(expected)
+        assert calculate_rsi(np.array(prices, dtype=np.float64)) == pytest.approx(expected)
+
 
 # ─── ATR Calculation ───────────────────────────────────────────
 
@@ -78,6 +106,40 @@ class TestCalculateATR:
         atr = calculate_atr(prices, period=14)
         assert atr > 0
 
+    def test_structured_array_matches_dicts(self):
+        """high/low/close structured array 입력 == dict 리스트 입력."""
+        prices = [{"high": 100 + i * 3 % 7, "low": 90 + i % 5, "close": 95 + i % 4} for i in range(20)]
+        arr = np.array(
+            [(p["high"], p["low"], p["close"]) for p in prices],
+            dtype=[("high", "f8"), ("low", "f8"), ("close", "f8")],
+        )
+        assert calculate_atr(arr) == pytest.approx(calculate_atr(prices))
+
+    def test_to_ohlc_array_from_daily_prices(self):
+        """DailyPrice 리스트 → OHLC structured array."""
+        from prime_jennie.domain.stock import DailyPrice
+
+        daily = [
+            DailyPrice(
+                stock_code="005930",
+                price_date=date(2026, 2, 2 + i),
+                open_price=70000,
+                high_price=71000 + i,
+                low_price=69000 - i,
+                close_price=70500,
+                volume=10000,
+            )
+            for i in range(3)
+        ]
+        arr = to_ohlc_array(daily)
+
+        assert arr.dtype == OHLC_DTYPE
+        assert arr["high"].tolist() == [71000.0, 71001.0, 71002.0]
+        assert arr["low"].tolist() == [69000.0, 68999.0, 68998.0]
+        assert calculate_atr(arr) == calculate_atr(
+            [{"high": p.high_price, "low": p.low_price, "close": p.close_price} for p in daily]
+        )
+
 
 # ─── BuySignal sector_group ───────────────────────────────────
 
@@ -123,6 +185,19 @@ class TestBuySignalSectorGroup:
 # ─── KISClient.get_daily_prices ───────────────────────────────
 
 
+_DAILY_ROWS = [
+    {
+        "stock_code": "005930",
+        "price_date": "2026-02-19",
+        "open_price": 70000,
+        "high_price": 71000,
+        "low_price": 69000,
+        "close_price": 70500,
+        "volume": 10000,
+    }
+]
+
+
 class TestKISClientDailyPrices:
     """KISClient.get_daily_prices() 메서드."""
 
@@ -131,35 +206,95 @@ class TestKISClientDailyPrices:
 
         assert hasattr(KISClient, "get_daily_prices")
 
-    @patch("prime_jennie.infra.kis.client.get_config")
-    def test_get_daily_prices_returns_list(self, mock_config):
-        from prime_jennie.domain.stock import DailyPrice
-        from prime_jennie.infra.kis.client import KISClient
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        from prime_jennie.infra.kis.client import clear_daily_prices_cache
 
-        mock_config.return_value.kis.gateway_url = "http://fake:8080"
+        clear_daily_prices_cache()
+        yield
+        clear_daily_prices_cache()
+
+    @staticmethod
+    def _make_client(rows: list[dict], base_url: str = "http://gw-a:8080"):
+        from prime_jennie.infra.kis.client import KISClient
 
         client = KISClient.__new__(KISClient)
+        client._base_url = base_url
         mock_http = MagicMock()
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = [
-            {
-                "stock_code": "005930",
-                "price_date": "2026-02-19",
-                "open_price": 70000,
-                "high_price": 71000,
-                "low_price": 69000,
-                "close_price": 70500,
-                "volume": 10000,
-            }
-        ]
-        mock_http.post.return_value = mock_resp
+        mock_http.post.return_value.content = json.dumps(rows).encode()
         client._client = mock_http
+        return client
+
+    def test_get_daily_prices_returns_list(self):
+        from prime_jennie.domain.stock import DailyPrice
+
+        client = self._make_client(_DAILY_ROWS)
 
         result = client.get_daily_prices("005930", days=30)
         assert len(result) == 1
         assert isinstance(result[0], DailyPrice)
         assert result[0].close_price == 70500
 
+    def test_get_daily_prices_cached_within_ttl(self):
+        """같은 (종목, 기간) 재조회 → TTL 내 HTTP 호출 1회."""
+        from prime_jennie.infra.kis import client as kis_client
+
+        client = self._make_client(_DAILY_ROWS)
+
+        client.get_daily_prices("005930", days=30)
+        client.get_daily_prices("005930", days=30)
+        client.get_daily_prices("005930", days=60)  # 기간이 다르면 별도 키
+        assert client._client.post.call_count == 2
+
+        # TTL 경과 → 재조회
+        key = (client._base_url, "005930", 30)
+        fetched_at, prices = kis_client._daily_prices_cache[key]
+        kis_client._daily_prices_cache[key] = (fetched_at - kis_client.DAILY_PRICES_TTL, prices)
+        client.get_daily_prices("005930", days=30)
+        assert client._client.post.call_count == 3
+
+    def test_cache_keyed_by_gateway(self):
+        """게이트웨이가 다른 클라이언트끼리는 캐시를 공유하지 않음."""
+        client_a = self._make_client(_DAILY_ROWS)
+        client_b = self._make_client(_DAILY_ROWS, base_url="http://gw-b:8080")
+        client_a.get_daily_prices("005930", days=30)
+        client_b.get_daily_prices("005930", days=30)
+
+        assert client_a._client.post.call_count == 1
+        assert client_b._client.post.call_count == 1
+
+    def test_empty_result_not_cached(self):
+        client = self._make_client([])
+        client.get_daily_prices("005930", days=30)
+        client.get_daily_prices("005930", days=30)
+        assert client._client.post.call_count == 2
+
+    def test_full_cache_evicts_oldest(self, monkeypatch):
+        from prime_jennie.infra.kis import client as kis_client
+
+        monkeypatch.setattr(kis_client, "_DAILY_PRICES_CACHE_MAX", 2)
+        client = self._make_client(_DAILY_ROWS)
+        for days in (10, 20, 30):
+            client.get_daily_prices("005930", days=days)
+
+        assert [key[2] for key in kis_client._daily_prices_cache] == [20, 30]
+
+    def test_get_daily_prices_bulk_fetches_only_uncached(self):
+        """캐시된 종목은 제외하고 한 번의 bulk 요청 → 결과는 단건 캐시에도 적재."""
+        client = self._make_client(_DAILY_ROWS)
+        client.get_daily_prices("005930", days=30)  # 캐시 적재
+        client._client.post.return_value.content = json.dumps({"000660": _DAILY_ROWS, "035420": _DAILY_ROWS}).encode()
+
+        result = client.get_daily_prices_bulk(["005930", "000660", "035420"], days=30)
+
+        assert set(result) == {"005930", "000660", "035420"}
+        bulk_call = client._client.post.call_args
+        assert bulk_call.args[0] == "/api/market/daily-prices/bulk"
+        assert bulk_call.kwargs["json"] == {"stock_codes": ["000660", "035420"], "days": 30}
+
+        client.get_daily_prices("000660", days=30)
+        assert client._client.post.call_count == 2
+
 
 # ─── BuyExecutor ATR with daily prices ─────────────────────────
 
@@ -216,6 +351,53 @@ class TestExecutorATR:
         assert atr == clamp_atr(70000 * 0.02, 70000)
 
 
+class TestExecutorCorrelation:
+    """BuyExecutor._check_correlation — 일괄 조회 실패 시 단건 폴백."""
+
+    @patch("prime_jennie.domain.config.get_config")
+    def test_falls_back_to_per_code_when_bulk_fails(self, mock_config):
+        from prime_jennie.domain.portfolio import Position
+        from prime_jennie.domain.stock import DailyPrice
+        from prime_jennie.services.buyer.executor import BuyExecutor
+
+        mock_config.return_value.risk.correlation_block_threshold = 0.85
+
+        def _daily(code, days):
+            if code == "000660":
+                raise Exception("network error")
+            return [
+                DailyPrice(
+                    stock_code=code,
+                    price_date=date(2026, 1, 1) + timedelta(days=i),
+                    open_price=70000,
+                    high_price=71000,
+                    low_price=69000,
+                    close_price=70000 + (i % 7) * 300,
+                    volume=10000,
+                )
+                for i in range(30)
+            ]
+
+        mock_kis = MagicMock()
+        mock_kis.get_daily_prices_bulk.side_effect = Exception("gateway down")
+        mock_kis.get_daily_prices.side_effect = _daily
+
+        executor = BuyExecutor.__new__(BuyExecutor)
+        executor._kis = mock_kis
+        executor._config = mock_config.return_value
+
+        positions = [
+            Position(stock_code=code, stock_name=code, quantity=1, average_buy_price=70000, total_buy_amount=70000)
+            for code in ("000660", "035420")
+        ]
+        passed, max_corr, reason = executor._check_correlation("005930", positions)
+
+        # 000660 단건 실패는 격리되고, 035420(동일 가격 패턴)과의 상관관계로 차단
+        assert passed is False
+        assert max_corr > 0.99
+        assert "035420" in reason
+
+
 # ─── PriceMonitor RSI ─────────────────────────────────────────
 
 
@@ -1,9 +1,14 @@
 """매수/매도 체결 텔레그램 알림 단위 테스트."""
 
+import time
 from datetime import UTC, datetime
 from unittest.mock import MagicMock, patch
 
+import pytest
+from pydantic import ValidationError
+
 from prime_jennie.domain.notification import TradeNotification
+from prime_jennie.services.telegram import app as telegram_app
 
 # ─── TradeNotification 모델 ─────────────────────────────────
 
@@ -60,6 +65,11 @@ class TestTradeNotification:
         assert restored.sell_reason == "PROFIT_TARGET"
         assert restored.signal_type is None
 
+    def test_notification_is_frozen(self):
+        n = self._make_buy_notification()
+        with pytest.raises(ValidationError):
+            n.quantity = 1
+
     def test_buy_optional_fields_default_none(self):
         n = TradeNotification(
             trade_type="BUY",
@@ -168,38 +178,62 @@ class TestFormatTradeMessage:
 
 
 class TestMuteCheck:
+    @pytest.fixture(autouse=True)
+    def _reset_mute_cache(self, monkeypatch):
+        monkeypatch.setattr(telegram_app, "_mute_cache", (0, False))
+
+    @pytest.mark.parametrize(
+        ("pttl", "expected"),
+        [
+            pytest.param(600_000, True, id="muted"),
+            pytest.param(-2, False, id="no_key"),
+        ],
+    )
     @patch("prime_jennie.services.telegram.app.get_redis")
-    def test_muted_skips_notification(self, mock_get_redis):
-        from prime_jennie.services.telegram.app import _is_muted
-
-        mock_redis = MagicMock()
-        mock_get_redis.return_value = mock_redis
-        # mute_until 은 미래 시각
-        import time
+    def test_is_muted(self, mock_get_redis, pttl, expected):
+        mock_get_redis.return_value.pttl.return_value = pttl
+        assert telegram_app._is_muted() is expected
+
+    @pytest.mark.parametrize(
+        ("offset_sec", "expected"),
+        [
+            pytest.param(600, True, id="legacy_future"),
+            pytest.param(-600, False, id="legacy_past"),
+        ],
+    )
+    @patch("prime_jennie.services.telegram.app.get_redis")
+    def test_legacy_key_without_ttl_uses_stored_time(self, mock_get_redis, offset_sec, expected):
+        """TTL 없는 구버전 키(-1) → 저장된 해제 시각으로 판단."""
+        mock_get_redis.return_value.pttl.return_value = -1
+        mock_get_redis.return_value.get.return_value = str(int(time.time()) + offset_sec)
+        assert telegram_app._is_muted() is expected
 
-        mock_redis.get.return_value = str(int(time.time()) + 600)
-        assert _is_muted() is True
+    @patch("prime_jennie.services.telegram.app.get_redis")
+    def test_redis_error_not_muted(self, mock_get_redis):
+        mock_get_redis.return_value.pttl.side_effect = Exception("Redis down")
+        assert telegram_app._is_muted() is False
 
     @patch("prime_jennie.services.telegram.app.get_redis")
-    def test_not_muted(self, mock_get_redis):
-        from prime_jennie.services.telegram.app import _is_muted
+    def test_result_cached_within_interval(self, mock_get_redis):
+        """확인 주기 내 재호출 → Redis 조회 1회."""
+        mock_get_redis.return_value.pttl.return_value = 600_000
+        assert telegram_app._is_muted() is True
 
-        mock_redis = MagicMock()
-        mock_get_redis.return_value = mock_redis
-        mock_redis.get.return_value = None
-        assert _is_muted() is False
+        mock_get_redis.return_value.pttl.return_value = -2
+        assert telegram_app._is_muted() is True
+        assert mock_get_redis.return_value.pttl.call_count == 1
 
     @patch("prime_jennie.services.telegram.app.get_redis")
-    def test_expired_mute(self, mock_get_redis):
-        from prime_jennie.services.telegram.app import _is_muted
+    def test_mute_command_invalidates_cache(self, mock_get_redis):
+        mock_get_redis.return_value.pttl.return_value = -2
+        assert telegram_app._is_muted() is False
 
-        mock_redis = MagicMock()
-        mock_get_redis.return_value = mock_redis
-        # mute_until 이 과거
-        import time
+        telegram_app._invalidate_mute_cache("/help")
+        mock_get_redis.return_value.pttl.return_value = 600_000
+        assert telegram_app._is_muted() is False
 
-        mock_redis.get.return_value = str(int(time.time()) - 100)
-        assert _is_muted() is False
+        telegram_app._invalidate_mute_cache("/mute")
+        assert telegram_app._is_muted() is True
 
 
 # ─── Buyer _notify_buy fire-and-forget ───────────────────────
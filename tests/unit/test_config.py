@@ -1,5 +1,8 @@
 """Configuration system unit tests."""
 
+import pytest
+from pydantic import ValidationError
+
 from prime_jennie.domain.config import AppConfig, get_config
 from prime_jennie.domain.enums import MarketRegime
 
@@ -23,12 +26,39 @@ class TestAppConfig:
         assert url.startswith("redis://")
         assert "localhost" in url
 
+    def test_connection_configs_frozen_and_url_follows_copy(self):
+        config = AppConfig()
+        assert config.db.url.endswith("@localhost:3307/prime_jennie")
+        assert config.redis.url == "redis://localhost:6379/0"
+
+        db = config.db.model_copy(update={"host": "db.internal"})
+        assert "@db.internal:3307/" in db.url
+        assert "@db.internal:3307/" in db.async_url
+        assert config.redis.model_copy(update={"db": 2}).url == "redis://localhost:6379/2"
+
+        with pytest.raises(ValidationError):
+            config.db.host = "other"
+        with pytest.raises(ValidationError):
+            config.redis.port = 1
+
     def test_risk_cash_floor(self):
         config = AppConfig()
         assert config.risk.get_cash_floor(MarketRegime.BULL) == 10.0
         assert config.risk.get_cash_floor(MarketRegime.BEAR) == 25.0
         assert config.risk.get_cash_floor(MarketRegime.STRONG_BEAR) == 25.0
 
+    def test_risk_cash_floor_env_override(self, monkeypatch):
+        """국면별 하한은 환경변수로 덮어쓴 필드에서 조회 시점에 읽음."""
+        monkeypatch.setenv("RISK_CASH_FLOOR_BULL_PCT", "12.5")
+        risk = AppConfig().risk
+        assert risk.get_cash_floor(MarketRegime.BULL) == 12.5
+        assert risk.get_cash_floor(MarketRegime.SIDEWAYS) == 15.0
+
+    def test_risk_cash_floor_follows_model_copy(self):
+        risk = AppConfig().risk
+        assert risk.get_cash_floor(MarketRegime.BULL) == 10.0
+        assert risk.model_copy(update={"cash_floor_bull_pct": 50.0}).get_cash_floor(MarketRegime.BULL) == 50.0
+
     def test_sub_config_count(self):
         config = AppConfig()
         # 12 sub-configs
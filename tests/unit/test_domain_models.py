@@ -29,131 +29,110 @@ from prime_jennie.domain import (
     WatchlistEntry,
 )
 
+_NOW = datetime.datetime(2026, 2, 19, 10, 0, 0)
+
+
+@pytest.fixture(scope="session")
+def now() -> datetime.datetime:
+    """고정 시각 — 테스트 결정성 확보."""
+    return _NOW
+
+
+@pytest.fixture(scope="session")
+def today() -> datetime.date:
+    return datetime.date(2026, 2, 19)
+
+
 # ─── QuantScore ──────────────────────────────────────────────────
 
+# 서브 점수 합계 = 60.0
+_BASE_QUANT = {
+    "stock_code": "005930",
+    "stock_name": "Test",
+    "momentum_score": 12.0,
+    "quality_score": 10.0,
+    "value_score": 15.0,
+    "technical_score": 8.0,
+    "news_score": 7.0,
+    "supply_demand_score": 8.0,
+}
+
 
 class TestQuantScore:
     def test_valid_score(self):
-        qs = QuantScore(
-            stock_code="005930",
-            stock_name="삼성전자",
-            total_score=60.0,
-            momentum_score=12.0,
-            quality_score=10.0,
-            value_score=15.0,
-            technical_score=8.0,
-            news_score=7.0,
-            supply_demand_score=8.0,
-        )
+        qs = QuantScore(**_BASE_QUANT, total_score=60.0)
         assert qs.total_score == 60.0
         assert qs.is_valid is True
 
-    def test_subscore_mismatch_rejected(self):
-        with pytest.raises(ValidationError, match="total_score"):
-            QuantScore(
-                stock_code="005930",
-                stock_name="Test",
-                total_score=99.0,
-                momentum_score=1.0,
-                quality_score=1.0,
-                value_score=1.0,
-                technical_score=1.0,
-                news_score=1.0,
-                supply_demand_score=1.0,
-            )
-
     def test_small_rounding_tolerance(self):
         """1.5 이내 오차는 허용."""
-        qs = QuantScore(
-            stock_code="005930",
-            stock_name="Test",
-            total_score=61.0,
-            momentum_score=12.0,
-            quality_score=10.0,
-            value_score=15.0,
-            technical_score=8.0,
-            news_score=7.0,
-            supply_demand_score=8.0,
-        )
+        qs = QuantScore(**_BASE_QUANT, total_score=61.0)
         assert qs.total_score == 61.0
 
-    def test_invalid_stock_code(self):
-        with pytest.raises(ValidationError):
-            QuantScore(
-                stock_code="ABC",
-                stock_name="Test",
-                total_score=0.0,
-            )
-
-    def test_score_out_of_range(self):
-        with pytest.raises(ValidationError):
-            QuantScore(
-                stock_code="005930",
-                stock_name="Test",
-                total_score=150.0,
-            )
+    @pytest.mark.parametrize(
+        ("overrides", "match"),
+        [
+            pytest.param({"total_score": 99.0}, "total_score", id="subscore_mismatch"),
+            pytest.param({"stock_code": "ABC", "total_score": 60.0}, "stock_code", id="invalid_stock_code"),
+            pytest.param({"total_score": 150.0}, "total_score", id="score_out_of_range"),
+        ],
+    )
+    def test_invalid(self, overrides, match):
+        with pytest.raises(ValidationError, match=match):
+            QuantScore(**{**_BASE_QUANT, **overrides})
 
 
 # ─── HybridScore ────────────────────────────────────────────────
 
+_BASE_HYBRID = {
+    "stock_code": "005930",
+    "stock_name": "Test",
+    "quant_score": 30.0,
+    "llm_score": 30.0,
+    "hybrid_score": 30.0,
+    "trade_tier": TradeTier.BLOCKED,
+}
 
-class TestHybridScore:
-    @pytest.fixture
-    def now(self):
-        return datetime.datetime.now()
 
+class TestHybridScore:
     def test_valid_hybrid(self, now):
         hs = HybridScore(
-            stock_code="005930",
-            stock_name="삼성전자",
-            quant_score=60.0,
-            llm_score=65.0,
-            hybrid_score=65.0,
+            **{
+                **_BASE_HYBRID,
+                "quant_score": 60.0,
+                "llm_score": 65.0,
+                "hybrid_score": 65.0,
+                "trade_tier": TradeTier.TIER1,
+            },
             risk_tag=RiskTag.NEUTRAL,
-            trade_tier=TradeTier.TIER1,
             is_tradable=True,
             scored_at=now,
         )
         assert hs.is_tradable is True
 
-    def test_blocked_must_not_be_tradable(self, now):
-        with pytest.raises(ValidationError, match="BLOCKED"):
-            HybridScore(
-                stock_code="005930",
-                stock_name="Test",
-                quant_score=30.0,
-                llm_score=30.0,
-                hybrid_score=30.0,
-                risk_tag=RiskTag.CAUTION,
-                trade_tier=TradeTier.BLOCKED,
-                is_tradable=True,
-                scored_at=now,
-            )
-
-    def test_distribution_risk_requires_veto(self, now):
-        with pytest.raises(ValidationError, match="DISTRIBUTION_RISK"):
-            HybridScore(
-                stock_code="005930",
-                stock_name="Test",
-                quant_score=30.0,
-                llm_score=30.0,
-                hybrid_score=30.0,
-                risk_tag=RiskTag.DISTRIBUTION_RISK,
-                trade_tier=TradeTier.BLOCKED,
-                is_tradable=False,
-                veto_applied=False,
-                scored_at=now,
-            )
+    @pytest.mark.parametrize(
+        ("overrides", "match"),
+        [
+            pytest.param(
+                {"risk_tag": RiskTag.CAUTION, "is_tradable": True},
+                "BLOCKED",
+                id="blocked_must_not_be_tradable",
+            ),
+            pytest.param(
+                {"risk_tag": RiskTag.DISTRIBUTION_RISK, "is_tradable": False, "veto_applied": False},
+                "DISTRIBUTION_RISK",
+                id="distribution_risk_requires_veto",
+            ),
+        ],
+    )
+    def test_invalid(self, now, overrides, match):
+        with pytest.raises(ValidationError, match=match):
+            HybridScore(**_BASE_HYBRID, scored_at=now, **overrides)
 
     def test_valid_blocked_with_veto(self, now):
         hs = HybridScore(
-            stock_code="005930",
-            stock_name="Test",
-            quant_score=30.0,
-            llm_score=30.0,
-            hybrid_score=30.0,
+            **_BASE_HYBRID,
             risk_tag=RiskTag.DISTRIBUTION_RISK,
-            trade_tier=TradeTier.BLOCKED,
             is_tradable=False,
             veto_applied=True,
             scored_at=now,
@@ -165,7 +144,7 @@ class TestHybridScore:
 
 
 class TestLLMAnalysis:
-    def test_reason_too_short(self):
+    def test_reason_too_short(self, now):
         with pytest.raises(ValidationError, match="reason"):
             LLMAnalysis(
                 stock_code="005930",
@@ -173,17 +152,17 @@ class TestLLMAnalysis:
                 clamped_score=65.0,
                 grade="B",
                 reason="Short",
-                scored_at=datetime.datetime.now(),
+                scored_at=now,
             )
 
-    def test_valid_analysis(self):
+    def test_valid_analysis(self, now):
         la = LLMAnalysis(
             stock_code="005930",
             raw_score=70.0,
             clamped_score=65.0,
             grade="B",
             reason="실적 개선 추세와 반도체 업황 회복 기대감 반영",
-            scored_at=datetime.datetime.now(),
+            scored_at=now,
         )
         assert la.grade == "B"
 
@@ -191,16 +170,20 @@ class TestLLMAnalysis:
 # ─── TradingContext ──────────────────────────────────────────────
 
 
+@pytest.fixture(scope="module")
+def default_tc() -> TradingContext:
+    return TradingContext.default()
+
+
 class TestTradingContext:
-    def test_default_is_conservative(self):
-        tc = TradingContext.default()
-        assert tc.market_regime == MarketRegime.SIDEWAYS
-        assert tc.position_multiplier == 0.8
-        assert tc.stop_loss_multiplier == 1.2
+    def test_default_is_conservative(self, default_tc):
+        assert default_tc.market_regime == MarketRegime.SIDEWAYS
+        assert default_tc.position_multiplier == 0.8
+        assert default_tc.stop_loss_multiplier == 1.2
 
-    def test_custom_context(self):
+    def test_custom_context(self, today):
         tc = TradingContext(
-            date=datetime.date.today(),
+            date=today,
             market_regime=MarketRegime.BULL,
             position_multiplier=1.2,
             favor_sectors=[SectorGroup.SEMICONDUCTOR_IT],
@@ -212,34 +195,33 @@ class TestTradingContext:
 
 # ─── HotWatchlist ────────────────────────────────────────────────
 
+# (stock_code, stock_name, llm_score, hybrid_score, is_tradable, trade_tier, veto_applied, risk_tag) — 순서가 rank
+_WATCHLIST_ROWS = [
+    ("005930", "삼성전자", 72.0, 68.0, True, TradeTier.TIER1, False, RiskTag.NEUTRAL),
+    ("000660", "SK하이닉스", 45.0, 43.0, False, TradeTier.BLOCKED, True, RiskTag.DISTRIBUTION_RISK),
+]
+
 
 class TestHotWatchlist:
-    @pytest.fixture
-    def watchlist(self):
-        return HotWatchlist(
-            generated_at=datetime.datetime.now(),
+    @pytest.fixture(scope="module")
+    def watchlist(self, now):
+        # 조회 헬퍼만 확인하므로 생성 시 검증은 생략
+        return HotWatchlist.model_construct(
+            generated_at=now,
             market_regime=MarketRegime.BULL,
             stocks=[
-                WatchlistEntry(
-                    stock_code="005930",
-                    stock_name="삼성전자",
-                    llm_score=72.0,
-                    hybrid_score=68.0,
-                    rank=1,
-                    is_tradable=True,
-                    trade_tier=TradeTier.TIER1,
-                ),
-                WatchlistEntry(
-                    stock_code="000660",
-                    stock_name="SK하이닉스",
-                    llm_score=45.0,
-                    hybrid_score=43.0,
-                    rank=2,
-                    is_tradable=False,
-                    trade_tier=TradeTier.BLOCKED,
-                    veto_applied=True,
-                    risk_tag=RiskTag.DISTRIBUTION_RISK,
-                ),
+                WatchlistEntry.model_construct(
+                    stock_code=code,
+                    stock_name=name,
+                    llm_score=llm,
+                    hybrid_score=hybrid,
+                    rank=rank,
+                    is_tradable=tradable,
+                    trade_tier=tier,
+                    veto_applied=veto,
+                    risk_tag=risk,
+                )
+                for rank, (code, name, llm, hybrid, tradable, tier, veto, risk) in enumerate(_WATCHLIST_ROWS, start=1)
             ],
             version="v20260219",
         )
@@ -259,139 +241,167 @@ class TestHotWatchlist:
     def test_get_stock_not_found(self, watchlist):
         assert watchlist.get_stock("999999") is None
 
+    def test_entry_is_frozen(self, watchlist):
+        with pytest.raises(ValidationError, match="frozen"):
+            watchlist.stocks[0].rank = 3
+
 
 # ─── SectorBudget ────────────────────────────────────────────────
 
+_GEN_AT = "2026-02-19T10:00:00"
+_HOT_SEMI = SectorBudgetEntry.model_construct(
+    sector_group=SectorGroup.SEMICONDUCTOR_IT,
+    tier=SectorTier.HOT,
+    watchlist_cap=5,
+    portfolio_cap=5,
+    effective_cap=4,
+    held_count=1,
+)
+_COOL_CONSTRUCTION_FULL = SectorBudgetEntry.model_construct(
+    sector_group=SectorGroup.CONSTRUCTION,
+    tier=SectorTier.COOL,
+    watchlist_cap=2,
+    portfolio_cap=2,
+    effective_cap=0,
+    held_count=2,
+)
+
 
 class TestSectorBudget:
-    def test_get_cap_existing(self):
-        sb = SectorBudget(
-            entries={
-                SectorGroup.SEMICONDUCTOR_IT: SectorBudgetEntry(
-                    sector_group=SectorGroup.SEMICONDUCTOR_IT,
-                    tier=SectorTier.HOT,
-                    watchlist_cap=5,
-                    portfolio_cap=5,
-                    effective_cap=4,
-                    held_count=1,
-                ),
-            },
-            generated_at="2026-02-19T10:00:00",
-        )
-        assert sb.get_cap(SectorGroup.SEMICONDUCTOR_IT) == 4
-
-    def test_get_cap_default(self):
-        sb = SectorBudget(entries={}, generated_at="2026-02-19T10:00:00")
-        assert sb.get_cap(SectorGroup.ETC) == 3  # WARM default
-
-    def test_is_available(self):
-        sb = SectorBudget(
-            entries={
-                SectorGroup.CONSTRUCTION: SectorBudgetEntry(
-                    sector_group=SectorGroup.CONSTRUCTION,
-                    tier=SectorTier.COOL,
-                    watchlist_cap=2,
-                    portfolio_cap=2,
-                    effective_cap=0,
-                    held_count=2,
-                ),
-            },
-            generated_at="2026-02-19T10:00:00",
-        )
-        assert sb.is_available(SectorGroup.CONSTRUCTION) is False
+    @pytest.mark.parametrize(
+        ("entries", "group", "expected_cap", "expected_available"),
+        [
+            pytest.param(
+                {SectorGroup.SEMICONDUCTOR_IT: _HOT_SEMI}, SectorGroup.SEMICONDUCTOR_IT, 4, True, id="existing"
+            ),
+            pytest.param({}, SectorGroup.ETC, 3, True, id="default_warm"),
+            pytest.param(
+                {SectorGroup.CONSTRUCTION: _COOL_CONSTRUCTION_FULL},
+                SectorGroup.CONSTRUCTION,
+                0,
+                False,
+                id="cap_exhausted",
+            ),
+        ],
+    )
+    def test_cap_and_availability(self, entries, group, expected_cap, expected_available):
+        sb = SectorBudget.model_construct(entries=entries, generated_at=_GEN_AT)
+        assert sb.get_cap(group) == expected_cap
+        assert sb.is_available(group) is expected_available
 
 
 # ─── PortfolioState ──────────────────────────────────────────────
 
+_CASH = 3_000_000
+_EVAL = 7_000_000
+_ASSET = _CASH + _EVAL
+
+
+@pytest.fixture(scope="module")
+def portfolio_with_positions(now) -> PortfolioState:
+    return PortfolioState.model_construct(
+        positions=[
+            Position.model_construct(
+                stock_code="005930",
+                stock_name="삼성전자",
+                quantity=10,
+                average_buy_price=70000,
+                total_buy_amount=700000,
+                sector_group=SectorGroup.SEMICONDUCTOR_IT,
+            ),
+            Position.model_construct(
+                stock_code="000660",
+                stock_name="SK하이닉스",
+                quantity=5,
+                average_buy_price=150000,
+                total_buy_amount=750000,
+                sector_group=SectorGroup.SEMICONDUCTOR_IT,
+            ),
+            Position.model_construct(
+                stock_code="068270",
+                stock_name="셀트리온",
+                quantity=3,
+                average_buy_price=200000,
+                total_buy_amount=600000,
+                sector_group=SectorGroup.BIO_HEALTH,
+            ),
+        ],
+        cash_balance=1_000_000,
+        total_asset=3_050_000,
+        stock_eval_amount=2_050_000,
+        position_count=3,
+        timestamp=now,
+    )
+
 
 class TestPortfolioState:
-    def test_cash_ratio_no_assets(self):
+    def test_cash_ratio_no_assets(self, now):
         ps = PortfolioState(
             positions=[],
             cash_balance=0,
             total_asset=0,
             stock_eval_amount=0,
             position_count=0,
-            timestamp=datetime.datetime.now(),
+            timestamp=now,
         )
         assert ps.cash_ratio == 1.0
 
-    def test_cash_ratio_normal(self):
+    def test_cash_ratio_normal(self, now):
         ps = PortfolioState(
             positions=[],
-            cash_balance=3_000_000,
-            total_asset=10_000_000,
-            stock_eval_amount=7_000_000,
+            cash_balance=_CASH,
+            total_asset=_ASSET,
+            stock_eval_amount=_EVAL,
             position_count=3,
-            timestamp=datetime.datetime.now(),
+            timestamp=now,
         )
-        assert abs(ps.cash_ratio - 0.3) < 0.001
+        assert ps.cash_ratio == pytest.approx(0.3, abs=1e-3)
 
-    def test_sector_distribution(self):
-        ps = PortfolioState(
-            positions=[
-                Position(
-                    stock_code="005930",
-                    stock_name="삼성전자",
-                    quantity=10,
-                    average_buy_price=70000,
-                    total_buy_amount=700000,
-                    sector_group=SectorGroup.SEMICONDUCTOR_IT,
-                ),
-                Position(
-                    stock_code="000660",
-                    stock_name="SK하이닉스",
-                    quantity=5,
-                    average_buy_price=150000,
-                    total_buy_amount=750000,
-                    sector_group=SectorGroup.SEMICONDUCTOR_IT,
-                ),
-                Position(
-                    stock_code="068270",
-                    stock_name="셀트리온",
-                    quantity=3,
-                    average_buy_price=200000,
-                    total_buy_amount=600000,
-                    sector_group=SectorGroup.BIO_HEALTH,
-                ),
-            ],
-            cash_balance=1_000_000,
-            total_asset=3_050_000,
-            stock_eval_amount=2_050_000,
-            position_count=3,
-            timestamp=datetime.datetime.now(),
-        )
-        dist = ps.sector_distribution
-        assert dist[SectorGroup.SEMICONDUCTOR_IT] == 2
-        assert dist[SectorGroup.BIO_HEALTH] == 1
+    def test_sector_distribution(self, portfolio_with_positions):
+        assert portfolio_with_positions.sector_distribution == {
+            SectorGroup.SEMICONDUCTOR_IT: 2,
+            SectorGroup.BIO_HEALTH: 1,
+        }
 
 
 # ─── BuySignal ───────────────────────────────────────────────────
 
 
+def _make_buy_signal(**overrides) -> BuySignal:
+    defaults = {
+        "stock_code": "005930",
+        "stock_name": "삼성전자",
+        "signal_type": SignalType.MOMENTUM,
+        "signal_price": 78000,
+        "llm_score": 72.0,
+        "hybrid_score": 68.0,
+        "trade_tier": TradeTier.TIER1,
+        "market_regime": MarketRegime.BULL,
+        "timestamp": _NOW,
+    }
+    defaults.update(overrides)
+    return BuySignal(**defaults)
+
+
+def _make_order_request(**overrides) -> OrderRequest:
+    defaults = {
+        "stock_code": "005930",
+        "quantity": 10,
+        "order_type": OrderType.LIMIT,
+        "price": 78000,
+    }
+    defaults.update(overrides)
+    return OrderRequest(**defaults)
+
+
 class TestBuySignal:
     def test_valid_signal(self):
-        bs = BuySignal(
-            stock_code="005930",
-            stock_name="삼성전자",
-            signal_type=SignalType.MOMENTUM,
-            signal_price=78000,
-            llm_score=72.0,
-            hybrid_score=68.0,
-            trade_tier=TradeTier.TIER1,
-            market_regime=MarketRegime.BULL,
-            timestamp=datetime.datetime.now(),
-        )
+        bs = _make_buy_signal()
         assert bs.source == "scanner"
         assert bs.position_multiplier == 1.0
 
     def test_limit_order_fields(self):
-        req = OrderRequest(
-            stock_code="005930",
-            quantity=10,
-            order_type=OrderType.LIMIT,
-            price=78000,
-        )
+        req = _make_order_request()
         assert req.price == 78000
 
 
@@ -399,9 +409,9 @@ class TestBuySignal:
 
 
 class TestMacroInsight:
-    def test_valid_insight(self):
+    def test_valid_insight(self, today):
         mi = MacroInsight(
-            insight_date=datetime.date.today(),
+            insight_date=today,
             sentiment=Sentiment.NEUTRAL_TO_BULLISH,
             sentiment_score=65.0,
             regime_hint="BULL",
@@ -412,10 +422,10 @@ class TestMacroInsight:
         assert mi.political_risk_level == "low"
         assert len(mi.sectors_to_favor) == 1
 
-    def test_position_size_bounds(self):
+    def test_position_size_bounds(self, today):
         with pytest.raises(ValidationError):
             MacroInsight(
-                insight_date=datetime.date.today(),
+                insight_date=today,
                 sentiment=Sentiment.BULLISH,
                 sentiment_score=80.0,
                 regime_hint="BULL",